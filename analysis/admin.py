@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Analysis
+from .models import Analysis, AnalysisDailyStats, JobPosting
 
 
 @admin.register(Analysis)
@@ -8,3 +8,15 @@ class AnalysisAdmin(admin.ModelAdmin):
     list_display = ("id", "resume", "match_score", "predicted_role", "created_at")
     list_filter = ("predicted_role", "created_at")
     search_fields = ("resume__user__email",)
+
+
+@admin.register(JobPosting)
+class JobPostingAdmin(admin.ModelAdmin):
+    list_display = ("id", "title", "is_active", "created_at")
+    list_filter = ("is_active",)
+    search_fields = ("title",)
+
+
+@admin.register(AnalysisDailyStats)
+class AnalysisDailyStatsAdmin(admin.ModelAdmin):
+    list_display = ("day", "analyses", "average_match_score", "updated_at")
@@ -1,29 +1,63 @@
+from datetime import timedelta
+
+from django.db.models import Avg, Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.urls import path
+from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from users.models import User
 from resumes.models import Resume
+from .ai import AI_POOL
+from .cache import AI_SUGGESTION_CACHE, JD_CACHE
 from .models import Analysis
+from .serializers import MAX_TIMESERIES_DAYS, StatsTimeseriesSerializer
+from .stats import HISTOGRAM_BUCKETS, daily_stats_series
 from users.permissions import IsAdminRole
-from users.serializers import UserListSerializer
+from users.pagination import DateJoinedKeysetPagination
+from users.serializers import AdminUserFilterSerializer, AdminUserListSerializer, UserListSerializer
 
 
 class AdminViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated, IsAdminRole]
 
     def users(self, request):
-        users = User.objects.all().order_by("-date_joined")
-        serializer = UserListSerializer(users, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        filters = AdminUserFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        data = filters.validated_data
+
+        users = User.objects.only(*UserListSerializer.Meta.fields)
+        if data.get("email"):
+            users = users.filter(email__istartswith=data["email"])
+        if data.get("role"):
+            users = users.filter(role=data["role"])
+        if data.get("is_active") is not None:
+            users = users.filter(is_active=data["is_active"])
+        users = users.annotate(
+            resume_count=_count_subquery(Resume.objects.filter(user=OuterRef("pk")), "user"),
+            analysis_count=_count_subquery(Analysis.objects.filter(resume__user=OuterRef("pk")), "resume__user"),
+        )
+
+        page, next_cursor = DateJoinedKeysetPagination().paginate_queryset(users, data.get("cursor"), data["page_size"])
+        return Response(
+            {"results": AdminUserListSerializer(page, many=True).data, "next_cursor": next_cursor},
+            status=status.HTTP_200_OK,
+        )
 
     def stats(self, request):
         total_users = User.objects.count()
         total_resumes = Resume.objects.count()
-        total_analyses = Analysis.objects.count()
-        avg_match = list(Analysis.objects.values_list("match_score", flat=True))
-        avg_score = round(sum(avg_match) / len(avg_match), 2) if avg_match else 0.0
+        scores = Analysis.objects.aggregate(total=Count("id"), average=Avg("match_score"))
+        total_analyses = scores["total"]
+        avg_score = round(scores["average"] or 0.0, 2)
+        dedup = Resume.objects.exclude(content_hash="").aggregate(
+            hashed_uploads=Count("id"),
+            reused_parses=Count("id", filter=Q(parse_reused=True)),
+            unique_files=Count("content_hash", distinct=True),
+        )
+        dedup["hit_rate"] = round(dedup["reused_parses"] / dedup["hashed_uploads"], 4) if dedup["hashed_uploads"] else 0.0
 
         return Response(
             {
@@ -31,12 +65,45 @@ class AdminViewSet(viewsets.ViewSet):
                 "total_resumes": total_resumes,
                 "total_analyses": total_analyses,
                 "average_match_score": avg_score,
+                "jd_cache": JD_CACHE.stats(),
+                "resume_dedup": dedup,
+                "ai_suggestions": AI_POOL.stats(),
+                "ai_suggestion_cache": AI_SUGGESTION_CACHE.stats(),
             },
             status=status.HTTP_200_OK,
         )
 
+    def stats_timeseries(self, request):
+        serializer = StatsTimeseriesSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        end = serializer.validated_data.get("end") or timezone.localdate()
+        start = serializer.validated_data.get("start") or end - timedelta(days=serializer.validated_data["days"] - 1)
+        if start > end:
+            return Response({"detail": "start must be on or before end"}, status=status.HTTP_400_BAD_REQUEST)
+        if (end - start).days >= MAX_TIMESERIES_DAYS:
+            return Response(
+                {"detail": f"Range must be at most {MAX_TIMESERIES_DAYS} days"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            {
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "histogram_bucket_width": 100 // HISTOGRAM_BUCKETS,
+                "days": daily_stats_series(start, end),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+def _count_subquery(queryset, group_by: str):
+    # Correlated COUNT per user; unlike two Count() joins, the counts cannot multiply each other.
+    counts = queryset.order_by().values(group_by).annotate(total=Count("id")).values("total")
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
 
 urlpatterns = [
     path("users/", AdminViewSet.as_view({"get": "users"}), name="admin-users"),
     path("stats/", AdminViewSet.as_view({"get": "stats"}), name="admin-stats"),
+    path("stats/timeseries/", AdminViewSet.as_view({"get": "stats_timeseries"}), name="admin-stats-timeseries"),
 ]
@@ -0,0 +1,176 @@
+import importlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+AI_MAX_WORKERS = int(os.getenv("OPENAI_MAX_WORKERS", "4"))
+AI_MAX_QUEUE = int(os.getenv("OPENAI_MAX_QUEUE", "32"))
+AI_QUEUE_TIMEOUT_SECONDS = float(os.getenv("OPENAI_QUEUE_TIMEOUT_SECONDS", "0"))
+AI_ASYNC_BACKEND = os.getenv("OPENAI_ASYNC_BACKEND", "pool")
+
+_client = None
+_client_config = None
+_client_lock = threading.Lock()
+
+
+def get_client(openai):
+    """One OpenAI client per process, rebuilt when the key, base URL or timeout change."""
+    global _client, _client_config
+    config = (
+        os.getenv("OPENAI_API_KEY"),
+        os.getenv("OPENAI_API_BASE") or None,
+        float(os.getenv("OPENAI_TIMEOUT_SECONDS", "4")),
+    )
+    if _client is not None and config == _client_config:
+        return _client
+    with _client_lock:
+        if _client is None or config != _client_config:
+            api_key, base_url, timeout_seconds = config
+            # Sized for the worker pool plus a couple of synchronous callers.
+            connections = AI_MAX_WORKERS + 2
+            _client = openai.OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                max_retries=0,
+                timeout=timeout_seconds,
+                http_client=openai.DefaultHttpxClient(limits=_http_limits(openai, connections)),
+            )
+            _client_config = config
+    return _client
+
+
+def _http_limits(openai, connections: int):
+    # The SDK has shipped on both httpx and its httpx2 fork; use the package its client is built on.
+    package = importlib.import_module(openai.DefaultHttpxClient.__mro__[1].__module__.split(".")[0])
+    return package.Limits(max_connections=connections, max_keepalive_connections=connections)
+
+
+def _reset_client():
+    global _client, _client_config
+    _client = None
+    _client_config = None
+
+
+# The HTTP connection pool must not be shared across a fork.
+os.register_at_fork(after_in_child=_reset_client)
+
+
+class BoundedExecutor:
+    """Thread pool capped at max_workers + max_queue jobs; `submit` returns False when full."""
+
+    def __init__(self, max_workers: int, max_queue: int, queue_timeout: float = 0.0, name: str = "pool"):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.name = name
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._executor = None
+        self._lock = threading.Lock()
+        self._counters = {"submitted": 0, "shed": 0, "completed": 0, "failed": 0}
+        self._pending = 0
+        self._running = 0
+        self._waits = deque(maxlen=512)
+        self._runs = deque(maxlen=512)
+
+    def submit(self, func, *args) -> bool:
+        # Wait up to queue_timeout for a slot; 0 sheds immediately.
+        if self.queue_timeout > 0:
+            acquired = self._slots.acquire(timeout=self.queue_timeout)
+        else:
+            acquired = self._slots.acquire(blocking=False)
+        if not acquired:
+            with self._lock:
+                self._counters["shed"] += 1
+            return False
+
+        with self._lock:
+            self._counters["submitted"] += 1
+            self._pending += 1
+        try:
+            self._get_executor().submit(self._run, time.monotonic(), func, args)
+        except RuntimeError:
+            # The interpreter is shutting down; treat it like a full queue.
+            with self._lock:
+                self._pending -= 1
+                self._counters["shed"] += 1
+            self._slots.release()
+            return False
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._counters)
+            stats.update(
+                {
+                    "queue_depth": self._pending,
+                    "running": self._running,
+                    "max_workers": self.max_workers,
+                    "max_queue": self.max_queue,
+                    "queue_wait_ms": _percentiles(self._waits),
+                    "run_ms": _percentiles(self._runs),
+                }
+            )
+        return stats
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _run(self, submitted_at: float, func, args):
+        started = time.monotonic()
+        with self._lock:
+            self._pending -= 1
+            self._running += 1
+            self._waits.append((started - submitted_at) * 1000)
+        outcome = "completed"
+        try:
+            func(*args)
+        except Exception:
+            outcome = "failed"
+            logger.exception("%s job failed.", self.name)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._counters[outcome] += 1
+                self._runs.append((time.monotonic() - started) * 1000)
+            self._slots.release()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        return self._executor
+
+    def _after_fork(self):
+        # Threads do not survive fork; start the child with an empty pool and fresh counters.
+        self._executor = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._counters = dict.fromkeys(self._counters, 0)
+        self._pending = 0
+        self._running = 0
+        self._waits = deque(maxlen=self._waits.maxlen)
+        self._runs = deque(maxlen=self._runs.maxlen)
+
+
+def _percentiles(samples) -> dict:
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    return {
+        "p50": round(ordered[len(ordered) // 2], 1),
+        "p95": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 1),
+        "max": round(ordered[-1], 1),
+    }
+
+
+AI_POOL = BoundedExecutor(AI_MAX_WORKERS, AI_MAX_QUEUE, AI_QUEUE_TIMEOUT_SECONDS, name="ai-suggestions")
+os.register_at_fork(after_in_child=AI_POOL._after_fork)
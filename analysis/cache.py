@@ -0,0 +1,277 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Iterator
+
+from django.core.cache import caches
+
+from utils.nlp import document_features, features_version
+
+logger = logging.getLogger(__name__)
+
+
+def job_description_hash(job_description: str) -> str:
+    normalized = " ".join((job_description or "").lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class JobDescriptionCache:
+    """Two-tier cache of job-description features: per-process LRU, then the Django cache."""
+
+    def __init__(self, maxsize: int, timeout: int, alias: str = "default"):
+        self.local = LRUCache(maxsize)
+        self.timeout = timeout
+        self.alias = alias
+        self._counters = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def key(self, job_description: str) -> str:
+        return f"jd-features:{features_version()}:{job_description_hash(job_description)}"
+
+    def get_features(self, job_description: str) -> dict:
+        key = self.key(job_description)
+
+        features = self.local.get(key)
+        if features is not None:
+            self._count("local_hits")
+            return features
+
+        features = self._shared_get(key)
+        if features is not None:
+            self._count("shared_hits")
+            self.local.set(key, features)
+            return features
+
+        self._count("misses")
+        features = document_features(job_description)
+        self.local.set(key, features)
+        self._shared_set(key, features)
+        return features
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = sum(counters.values())
+        hits = counters["local_hits"] + counters["shared_hits"]
+        return {
+            **counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "local_size": len(self.local),
+            "local_maxsize": self.local.maxsize,
+        }
+
+    def clear(self):
+        self.local.clear()
+        with self._lock:
+            self._counters = dict.fromkeys(self._counters, 0)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _shared_get(self, key: str):
+        try:
+            return caches[self.alias].get(key)
+        except Exception:
+            logger.warning("Shared JD cache read failed.", exc_info=True)
+            return None
+
+    def _shared_set(self, key: str, features: dict):
+        try:
+            caches[self.alias].set(key, features, self.timeout)
+        except Exception:
+            logger.warning("Shared JD cache write failed.", exc_info=True)
+
+
+JD_CACHE = JobDescriptionCache(
+    maxsize=int(os.getenv("JD_CACHE_SIZE", "512")),
+    timeout=int(os.getenv("JD_CACHE_TIMEOUT_SECONDS", "86400")),
+)
+
+
+def job_description_features(job_description: str) -> dict:
+    return JD_CACHE.get_features(job_description)
+
+
+class AISuggestionCache:
+    """AI suggestion lines by hash of model + prompt: per-process LRU with TTL, then the Django cache."""
+
+    def __init__(self, maxsize: int, timeout: int, wait_timeout: float, alias: str = "default"):
+        self.local = LRUCache(maxsize)
+        self.timeout = timeout
+        self.wait_timeout = wait_timeout
+        self.alias = alias
+        self._counters = {"local_hits": 0, "shared_hits": 0, "coalesced": 0, "upstream_calls": 0}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def key(self, prompt: str, model: str) -> str:
+        digest = hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+        return f"ai-suggestions:{digest}"
+
+    def get_or_compute(self, prompt: str, model: str, compute) -> list[str]:
+        return list(self.stream(prompt, model, lambda: iter(compute())))
+
+    def stream(self, prompt: str, model: str, produce) -> Iterator[str]:
+        """Yield lines from the cache, a concurrent identical call, or `produce()` as they arrive."""
+        key = self.key(prompt, model)
+        lines = self._lookup(key)
+        if lines is not None:
+            yield from lines
+            return
+
+        # Identical calls in this process wait on the first caller's future.
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            self._count("coalesced")
+            try:
+                lines = future.result(timeout=self.wait_timeout)
+            except Exception:
+                return
+            yield from lines
+            return
+
+        lines = []
+        completed = False
+        lock_key = f"{key}:lock"
+        try:
+            # Take the cross-process lock, or wait for the process holding it to store its result.
+            locked = self._shared_add(lock_key)
+            shared = None if locked else self._wait_for_peer(key)
+            if shared is not None:
+                lines = shared
+                yield from lines
+            else:
+                try:
+                    self._count("upstream_calls")
+                    for line in produce():
+                        lines.append(line)
+                        yield line
+                    # Empty results mean the upstream call failed; do not cache them.
+                    if lines:
+                        self.local.set(key, (time.monotonic() + self.timeout, lines))
+                        self._shared_set(key, lines)
+                finally:
+                    # Only release a lock this call took; after a timed-out wait it belongs to another worker.
+                    if locked:
+                        self._shared_delete(lock_key)
+            completed = True
+        finally:
+            # A caller that stopped reading early leaves a partial result; waiters get nothing.
+            future.set_result(lines if completed else [])
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+        saved = counters["local_hits"] + counters["shared_hits"] + counters["coalesced"]
+        requests = saved + counters["upstream_calls"]
+        return {
+            **counters,
+            "upstream_calls_saved": saved,
+            "hit_rate": round(saved / requests, 4) if requests else 0.0,
+            "local_size": len(self.local),
+            "local_maxsize": self.local.maxsize,
+        }
+
+    def clear(self):
+        self.local.clear()
+        with self._lock:
+            self._counters = dict.fromkeys(self._counters, 0)
+
+    def _lookup(self, key: str):
+        entry = self.local.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._count("local_hits")
+            return entry[1]
+
+        lines = self._shared_get(key)
+        if lines is not None:
+            self._count("shared_hits")
+            self.local.set(key, (time.monotonic() + self.timeout, lines))
+        return lines
+
+    def _wait_for_peer(self, key: str):
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            lines = self._shared_get(key)
+            if lines is not None:
+                self._count("coalesced")
+                self.local.set(key, (time.monotonic() + self.timeout, lines))
+                return lines
+        return None
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _shared_get(self, key: str):
+        try:
+            return caches[self.alias].get(key)
+        except Exception:
+            logger.warning("Shared AI suggestion cache read failed.", exc_info=True)
+            return None
+
+    def _shared_set(self, key: str, lines: list[str]):
+        try:
+            caches[self.alias].set(key, lines, self.timeout)
+        except Exception:
+            logger.warning("Shared AI suggestion cache write failed.", exc_info=True)
+
+    def _shared_add(self, key: str) -> bool:
+        try:
+            return caches[self.alias].add(key, 1, int(self.wait_timeout) + 1)
+        except Exception:
+            logger.warning("Shared AI suggestion lock failed.", exc_info=True)
+            return True
+
+    def _shared_delete(self, key: str):
+        try:
+            caches[self.alias].delete(key)
+        except Exception:
+            logger.warning("Shared AI suggestion lock release failed.", exc_info=True)
+
+
+AI_SUGGESTION_CACHE = AISuggestionCache(
+    maxsize=int(os.getenv("OPENAI_CACHE_SIZE", "1024")),
+    timeout=int(os.getenv("OPENAI_CACHE_TIMEOUT_SECONDS", "604800")),
+    wait_timeout=float(os.getenv("OPENAI_TIMEOUT_SECONDS", "4")) + 1,
+)
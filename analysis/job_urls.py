@@ -0,0 +1,49 @@
+from django.urls import path
+from rest_framework import status, viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from users.permissions import IsAdminRole
+from .models import JobPosting
+from .ranking import compute_job_posting_features
+from .serializers import JobPostingSerializer
+
+
+class JobPostingViewSet(viewsets.ViewSet):
+    permission_classes = [IsAuthenticated]
+
+    def get_permissions(self):
+        if self.action in {"create", "partial_update"}:
+            return [IsAuthenticated(), IsAdminRole()]
+        return super().get_permissions()
+
+    def list(self, request):
+        queryset = JobPosting.objects.filter(is_active=True)
+        return Response(JobPostingSerializer(queryset, many=True).data)
+
+    def create(self, request):
+        serializer = JobPostingSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        posting = JobPosting(created_by=request.user, **serializer.validated_data)
+        compute_job_posting_features(posting, save=False)
+        posting.save()
+        return Response(JobPostingSerializer(posting).data, status=status.HTTP_201_CREATED)
+
+    def partial_update(self, request, pk=None):
+        try:
+            posting = JobPosting.objects.get(id=pk)
+        except JobPosting.DoesNotExist:
+            return Response({"detail": "Job posting not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = JobPostingSerializer(posting, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        posting = serializer.save()
+        if "description" in serializer.validated_data:
+            compute_job_posting_features(posting)
+        return Response(JobPostingSerializer(posting).data)
+
+
+urlpatterns = [
+    path("", JobPostingViewSet.as_view({"get": "list", "post": "create"}), name="job-postings"),
+    path("<int:pk>/", JobPostingViewSet.as_view({"patch": "partial_update"}), name="job-posting-detail"),
+]
@@ -0,0 +1,23 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from analysis.stats import rebuild_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily analysis rollups used by the admin stats time series."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", help="Only rebuild days on or after this date (YYYY-MM-DD)")
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            try:
+                since = date.fromisoformat(options["since"])
+            except ValueError as exc:
+                raise CommandError(f"Invalid --since date: {exc}") from exc
+
+        days = rebuild_daily_stats(since=since)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt analysis rollups for {days} days."))
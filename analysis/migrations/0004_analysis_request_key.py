@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analysis", "0003_jobposting"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="analysis",
+            name="request_key",
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
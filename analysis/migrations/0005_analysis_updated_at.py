@@ -0,0 +1,24 @@
+from django.db import migrations, models
+from django.db.models import F
+import django.utils.timezone
+
+
+def backfill_updated_at(apps, schema_editor):
+    Analysis = apps.get_model("analysis", "Analysis")
+    Analysis.objects.update(updated_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analysis", "0004_analysis_request_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="analysis",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analysis", "0005_analysis_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnalysisDailyStats",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("day", models.DateField(unique=True)),
+                ("analyses", models.PositiveIntegerField(default=0)),
+                ("score_sum", models.FloatField(default=0.0)),
+                ("histogram", models.JSONField(blank=True, default=list)),
+                ("roles", models.JSONField(blank=True, default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={"ordering": ["-day"]},
+        ),
+    ]
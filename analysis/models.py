@@ -13,10 +13,50 @@ class Analysis(models.Model):
     skills_missing = models.JSONField(default=list)
     suggestions = models.TextField(blank=True)
     predicted_role = models.CharField(max_length=100, blank=True)
+    request_key = models.CharField(max_length=64, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
 
     def __str__(self):
         return f"Analysis {self.id} - Resume {self.resume_id}"
+
+
+class AnalysisDailyStats(models.Model):
+    day = models.DateField(unique=True)
+    analyses = models.PositiveIntegerField(default=0)
+    score_sum = models.FloatField(default=0.0)
+    histogram = models.JSONField(default=list, blank=True)
+    roles = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-day"]
+
+    def __str__(self):
+        return f"AnalysisDailyStats {self.day}"
+
+    @property
+    def average_match_score(self) -> float:
+        return round(self.score_sum / self.analyses, 2) if self.analyses else 0.0
+
+
+class JobPosting(models.Model):
+    title = models.CharField(max_length=200)
+    description = models.TextField()
+    created_by = models.ForeignKey(
+        "users.User", on_delete=models.SET_NULL, null=True, blank=True, related_name="job_postings"
+    )
+    is_active = models.BooleanField(default=True, db_index=True)
+    features = models.JSONField(default=dict, blank=True)
+    features_version = models.CharField(max_length=64, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"JobPosting {self.id} - {self.title}"
@@ -0,0 +1,110 @@
+import os
+
+import numpy as np
+
+from ml.keywords import KEYWORD_MODEL
+from resumes.models import Resume
+from resumes.services import ensure_resume_features
+from utils.nlp import features_version
+
+from .cache import job_description_features
+from .models import JobPosting
+from .scoring import score_job_postings, score_resumes
+
+MAX_RANK_CANDIDATES = int(os.getenv("RANK_MAX_CANDIDATES", "10000"))
+
+
+def rank_resumes(queryset, job_description: str, page: int = 1, page_size: int = 25) -> dict:
+    resumes = list(
+        queryset.order_by("-uploaded_at").only("id", "user_id", "uploaded_at", "features", "features_version")[
+            :MAX_RANK_CANDIDATES
+        ]
+    )
+    if not resumes:
+        return {"count": 0, "page": page, "page_size": page_size, "results": []}
+
+    features = ensure_resume_features(resumes)
+    jd_features = job_description_features(job_description)
+    scores = score_resumes(features, jd_features, KEYWORD_MODEL)
+
+    order = np.argsort(-scores["match_score"], kind="stable")
+    start = (page - 1) * page_size
+    jd_skills = set(jd_features["skills"])
+
+    results = []
+    for rank, position in enumerate(order[start : start + page_size], start=start + 1):
+        resume = resumes[position]
+        results.append(
+            {
+                "rank": rank,
+                "resume_id": resume.id,
+                "user_id": resume.user_id,
+                "uploaded_at": resume.uploaded_at,
+                **{name: round(float(values[position]), 2) for name, values in scores.items()},
+                "skills_missing": sorted(jd_skills - set(features[position]["skills"])),
+            }
+        )
+
+    return {"count": len(resumes), "page": page, "page_size": page_size, "results": results}
+
+
+def compute_job_posting_features(posting: JobPosting, save: bool = True) -> dict:
+    features = dict(job_description_features(posting.description))
+    if KEYWORD_MODEL.available():
+        features["keyword_vector"] = KEYWORD_MODEL.vector(features["processed"])
+    posting.features = features
+    posting.features_version = features_version()
+    if save and posting.pk:
+        posting.save(update_fields=["features", "features_version"])
+    return features
+
+
+def ensure_job_posting_features(postings: list[JobPosting]) -> list[dict]:
+    version = features_version()
+    keyword_version = KEYWORD_MODEL.version if KEYWORD_MODEL.available() else None
+    stale = [
+        posting
+        for posting in postings
+        if posting.features_version != version
+        or (keyword_version and posting.features.get("keyword_vector", {}).get("version") != keyword_version)
+    ]
+    if stale:
+        descriptions = dict(
+            JobPosting.objects.filter(id__in=[posting.id for posting in stale]).values_list("id", "description")
+        )
+        for posting in stale:
+            posting.description = descriptions.get(posting.id, "")
+            compute_job_posting_features(posting, save=False)
+        JobPosting.objects.bulk_update(stale, ["features", "features_version"], batch_size=500)
+    return [posting.features for posting in postings]
+
+
+def match_job_postings(resume: Resume, queryset, top_k: int = 10) -> dict:
+    postings = list(queryset.only("id", "title", "features", "features_version"))
+    if not postings:
+        return {"resume_id": resume.id, "count": 0, "results": []}
+
+    resume_features = ensure_resume_features([resume])[0]
+    posting_features = ensure_job_posting_features(postings)
+    scores = score_job_postings(resume_features, posting_features, KEYWORD_MODEL)
+
+    match_scores = scores["match_score"]
+    top_k = min(top_k, len(postings))
+    candidates = np.argpartition(-match_scores, top_k - 1)[:top_k]
+    order = candidates[np.argsort(-match_scores[candidates], kind="stable")]
+    resume_skills = set(resume_features["skills"])
+
+    results = []
+    for rank, position in enumerate(order, start=1):
+        posting = postings[position]
+        results.append(
+            {
+                "rank": rank,
+                "job_posting_id": posting.id,
+                "title": posting.title,
+                **{name: round(float(values[position]), 2) for name, values in scores.items()},
+                "skills_missing": sorted(set(posting_features[position]["skills"]) - resume_skills),
+            }
+        )
+
+    return {"resume_id": resume.id, "count": len(postings), "results": results}
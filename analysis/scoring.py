@@ -0,0 +1,135 @@
+import hashlib
+import json
+
+import numpy as np
+from scipy import sparse
+
+from utils.nlp import processed_similarity_score
+
+SCORE_WEIGHTS = {
+    "keyword_similarity": 0.40,
+    "skill_match_score": 0.30,
+    "experience_relevance": 0.20,
+    "ats_compliance": 0.10,
+}
+# Bump when the scoring formula changes in a way the weights alone do not capture.
+SCORING_VERSION = 1
+
+
+def weights_version() -> str:
+    digest = hashlib.sha1(json.dumps(SCORE_WEIGHTS, sort_keys=True).encode("utf-8")).hexdigest()[:8]
+    return f"{SCORING_VERSION}:{digest}"
+
+
+def combine_scores(keyword_similarity, skill_match, experience_relevance, ats_compliance):
+    return (
+        keyword_similarity * SCORE_WEIGHTS["keyword_similarity"]
+        + skill_match * SCORE_WEIGHTS["skill_match_score"]
+        + experience_relevance * SCORE_WEIGHTS["experience_relevance"]
+        + ats_compliance * SCORE_WEIGHTS["ats_compliance"]
+    )
+
+
+def vectors_matrix(vectors: list[dict], n_features: int) -> sparse.csr_matrix:
+    indptr = np.zeros(len(vectors) + 1, dtype=np.int64)
+    for position, vector in enumerate(vectors):
+        indptr[position + 1] = indptr[position] + len(vector["indices"])
+    indices = np.fromiter(
+        (index for vector in vectors for index in vector["indices"]), dtype=np.int32, count=int(indptr[-1])
+    )
+    data = np.fromiter((value for vector in vectors for value in vector["data"]), dtype=np.float32, count=int(indptr[-1]))
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(vectors), n_features))
+
+
+def keyword_scores(left_vectors: list[dict], right_vector: dict, n_features: int) -> np.ndarray:
+    left = vectors_matrix(left_vectors, n_features)
+    right = vectors_matrix([right_vector], n_features)
+    return np.clip(np.asarray((left @ right.T).todense()).ravel() * 100, 0.0, 100.0)
+
+
+def fallback_keyword_scores(left_texts: list[str], right_text: str) -> np.ndarray:
+    return np.array([processed_similarity_score(text, right_text) for text in left_texts], dtype=np.float64)
+
+
+def skill_overlap_counts(skill_sets: list, reference_skills) -> np.ndarray:
+    reference_index = {skill: column for column, skill in enumerate(sorted(set(reference_skills)))}
+    if not reference_index:
+        return np.zeros(len(skill_sets))
+
+    rows, columns = [], []
+    for row, skills in enumerate(skill_sets):
+        for skill in set(skills):
+            column = reference_index.get(skill)
+            if column is not None:
+                rows.append(row)
+                columns.append(column)
+    indicator = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, columns)),
+        shape=(len(skill_sets), len(reference_index)),
+    )
+    return np.asarray(indicator.sum(axis=1)).ravel()
+
+
+def skill_match_scores(resume_skill_sets: list, jd_skills) -> np.ndarray:
+    jd_count = len(set(jd_skills))
+    if not jd_count:
+        return np.zeros(len(resume_skill_sets))
+    return skill_overlap_counts(resume_skill_sets, jd_skills) / jd_count * 100
+
+
+def experience_scores(resume_years, jd_years) -> np.ndarray:
+    resume_years = np.asarray(resume_years, dtype=np.float64)
+    jd_years = np.asarray(jd_years, dtype=np.float64)
+    ratio = np.minimum(resume_years / np.where(jd_years == 0, 1.0, jd_years), 1.25)
+    scores = np.clip(ratio * 80, 0.0, 100.0)
+    scores = np.where(resume_years == 0, 20.0, scores)
+    return np.where(jd_years == 0, 70.0, scores)
+
+
+def score_resumes(resume_features: list[dict], jd_features: dict, keyword_model=None) -> dict:
+    """Score many resumes against one job description; returns one array per component."""
+    if keyword_model is not None and keyword_model.available():
+        jd_vector = keyword_model.vector(jd_features["processed"])
+        keyword = keyword_scores([features["keyword_vector"] for features in resume_features], jd_vector, keyword_model.n_features)
+    else:
+        keyword = fallback_keyword_scores([features["processed"] for features in resume_features], jd_features["processed"])
+
+    skill = skill_match_scores([features["skills"] for features in resume_features], jd_features["skills"])
+    experience = experience_scores([features["years"] for features in resume_features], jd_features["years"])
+    ats = np.array([features["ats_compliance"] for features in resume_features], dtype=np.float64)
+
+    return {
+        "match_score": combine_scores(keyword, skill, experience, ats),
+        "keyword_similarity": keyword,
+        "skill_match_score": skill,
+        "experience_relevance": experience,
+        "ats_compliance": ats,
+    }
+
+
+def score_job_postings(resume_features: dict, posting_features: list[dict], keyword_model=None) -> dict:
+    """Score one resume against many job postings with the same components as `score_resumes`."""
+    if keyword_model is not None and keyword_model.available():
+        keyword = keyword_scores(
+            [features["keyword_vector"] for features in posting_features],
+            resume_features["keyword_vector"],
+            keyword_model.n_features,
+        )
+    else:
+        keyword = fallback_keyword_scores([features["processed"] for features in posting_features], resume_features["processed"])
+
+    posting_skill_sets = [features["skills"] for features in posting_features]
+    skill_counts = np.array([len(set(skills)) for skills in posting_skill_sets], dtype=np.float64)
+    overlap = skill_overlap_counts(posting_skill_sets, resume_features["skills"])
+    skill = np.divide(overlap * 100, skill_counts, out=np.zeros_like(skill_counts), where=skill_counts > 0)
+
+    experience = experience_scores(resume_features["years"], [features["years"] for features in posting_features])
+    ats = np.full(len(posting_features), float(resume_features["ats_compliance"]))
+
+    return {
+        "match_score": combine_scores(keyword, skill, experience, ats),
+        "keyword_similarity": keyword,
+        "skill_match_score": skill,
+        "experience_relevance": experience,
+        "ats_compliance": ats,
+    }
@@ -1,6 +1,8 @@
 from rest_framework import serializers
 
-from .models import Analysis
+from .models import Analysis, JobPosting
+
+MAX_TIMESERIES_DAYS = 366
 
 
 class AnalysisSerializer(serializers.ModelSerializer):
@@ -29,3 +31,34 @@ class AnalysisSerializer(serializers.ModelSerializer):
             "predicted_role",
             "created_at",
         )
+
+
+class AnalysisSummarySerializer(serializers.ModelSerializer):
+    """History row without the long text fields (job description, suggestions)."""
+
+    class Meta:
+        model = Analysis
+        fields = (
+            "id",
+            "resume",
+            "match_score",
+            "keyword_similarity",
+            "skill_match_score",
+            "experience_relevance",
+            "ats_compliance",
+            "predicted_role",
+            "created_at",
+        )
+
+
+class JobPostingSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = JobPosting
+        fields = ("id", "title", "description", "is_active", "created_at", "updated_at")
+        read_only_fields = ("id", "created_at", "updated_at")
+
+
+class StatsTimeseriesSerializer(serializers.Serializer):
+    days = serializers.IntegerField(required=False, min_value=1, max_value=MAX_TIMESERIES_DAYS, default=30)
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
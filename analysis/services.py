@@ -1,32 +1,46 @@
+import hashlib
 import logging
 import os
-import threading
+import time
+from typing import Iterator
+
+from django.core.cache import cache
+from django.db import transaction
 
 from resumes.models import Resume
+from resumes.services import get_resume_features, get_resume_keyword_vector
+from .ai import AI_ASYNC_BACKEND, AI_POOL, get_client
+from .cache import AI_SUGGESTION_CACHE, job_description_features, job_description_hash
 from .models import Analysis
-from ml.services import predict_role
+from .scoring import combine_scores, weights_version
+from .stats import record_analysis
+from ml.keywords import KEYWORD_MODEL, stored_vector_dot
+from ml.services import model_version, predict_role
 from utils.nlp import (
-    extract_skills,
-    keyword_similarity_score,
-    experience_relevance_score,
-    ats_compliance_score,
+    features_version,
+    processed_similarity_score,
+    years_relevance_score,
     generate_suggestions,
 )
 
-try:
-    from openai import OpenAI
-    from openai import APITimeoutError, APIConnectionError, RateLimitError
-except Exception:  # pragma: no cover
-    OpenAI = None
-    APITimeoutError = None
-    APIConnectionError = None
-    RateLimitError = None
-
 logger = logging.getLogger(__name__)
 
+ANALYSIS_LOCK_TIMEOUT_SECONDS = int(os.getenv("ANALYSIS_LOCK_TIMEOUT_SECONDS", "60"))
+ANALYSIS_WAIT_SECONDS = float(os.getenv("ANALYSIS_WAIT_SECONDS", "30"))
+ANALYSIS_POLL_SECONDS = 0.1
+
+
+def _openai():
+    # The SDK takes most of a second to import; only load it when AI is used.
+    try:
+        import openai
+    except Exception:  # pragma: no cover
+        return None
+    return openai
+
 
 def _should_use_ai() -> bool:
-    return bool(os.getenv("OPENAI_API_KEY")) and bool(OpenAI)
+    return bool(os.getenv("OPENAI_API_KEY")) and _openai() is not None
 
 
 def _build_ai_prompt(payload: dict) -> str:
@@ -49,32 +63,42 @@ def _build_ai_prompt(payload: dict) -> str:
 
 def _generate_ai_suggestions(payload: dict) -> list[str]:
     api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or not OpenAI:
+    openai = _openai()
+    if not api_key or openai is None:
         return []
 
+    prompt = _build_ai_prompt(payload)
+    model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
+    return AI_SUGGESTION_CACHE.get_or_compute(prompt, model, lambda: _request_ai_suggestions(openai, prompt, model))
+
+
+def _ai_payload(analysis: Analysis, resume_text: str) -> dict:
+    return {
+        "job_description": analysis.job_description or "",
+        "resume_excerpt": resume_text[:2000],
+        "match_score": analysis.match_score,
+        "keyword_similarity": analysis.keyword_similarity,
+        "skill_match_score": analysis.skill_match_score,
+        "experience_relevance": analysis.experience_relevance,
+        "ats_compliance": analysis.ats_compliance,
+        "skills_missing": analysis.skills_missing,
+        "predicted_role": analysis.predicted_role,
+    }
+
+
+def _request_ai_suggestions(openai, prompt: str, model: str) -> list[str]:
     try:
-        timeout_seconds = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "4"))
-        base_url = os.getenv("OPENAI_API_BASE") or None
-        client = OpenAI(
-            api_key=api_key,
-            base_url=base_url,
-            max_retries=0,
-            timeout=timeout_seconds,
-        )
-        response = client.responses.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4.1-mini"),
-            input=_build_ai_prompt(payload),
-            max_output_tokens=220,
-        )
+        client = get_client(openai)
+        response = client.responses.create(model=model, input=prompt, max_output_tokens=220)
         text = ""
         if response.output and response.output[0].content:
             text = response.output[0].content[0].text or ""
         lines = [line.strip() for line in text.splitlines() if line.strip()]
         return lines[:6]
-    except (APITimeoutError, APIConnectionError):
+    except (openai.APITimeoutError, openai.APIConnectionError):
         logger.warning("AI suggestions timed out or connection failed.")
         return []
-    except RateLimitError:
+    except openai.RateLimitError:
         logger.warning("AI suggestions rate-limited or out of quota.")
         return []
     except Exception:
@@ -82,33 +106,165 @@ def _generate_ai_suggestions(payload: dict) -> list[str]:
         return []
 
 
-def _append_ai_suggestions_async(analysis_id: int, payload: dict) -> None:
+def _stream_ai_lines(openai, prompt: str, model: str) -> Iterator[str]:
+    # Same request as `_request_ai_suggestions`, but yields each tip as soon as its line is complete.
+    count = 0
+    try:
+        client = get_client(openai)
+        with client.responses.create(model=model, input=prompt, max_output_tokens=220, stream=True) as events:
+            for line in _stream_text_lines(events):
+                if not line.strip():
+                    continue
+                count += 1
+                yield line.strip()
+                if count == 6:
+                    break
+    except (openai.APITimeoutError, openai.APIConnectionError):
+        logger.warning("AI suggestions stream timed out or connection failed.")
+    except openai.RateLimitError:
+        logger.warning("AI suggestions rate-limited or out of quota.")
+    except Exception:
+        logger.exception("AI suggestions stream failed.")
+
+
+def _stream_text_lines(events) -> Iterator[str]:
+    buffer = ""
+    for event in events:
+        if event.type == "response.output_text.delta":
+            buffer += event.delta
+            *complete, buffer = buffer.split("\n")
+            yield from complete
+    # The last tip usually has no trailing newline.
+    yield buffer
+
+
+def stream_ai_suggestions(analysis: Analysis) -> Iterator[str]:
+    """Yield AI tips for `analysis` as they are generated, then store them on the row.
+
+    Goes through AI_SUGGESTION_CACHE, so a cached or in-flight identical prompt is not sent
+    upstream again. Yields nothing when AI is not configured.
+    """
+    openai = _openai()
+    if not os.getenv("OPENAI_API_KEY") or openai is None:
+        return
+    prompt = _build_ai_prompt(_ai_payload(analysis, analysis.resume.extracted_text or ""))
+    model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
+    lines = []
+    for line in AI_SUGGESTION_CACHE.stream(prompt, model, lambda: _stream_ai_lines(openai, prompt, model)):
+        lines.append(line)
+        yield line
+    if lines:
+        _merge_ai_suggestions(analysis.id, lines)
+
+
+def _merge_ai_suggestions(analysis_id: int, ai_suggestions: list[str]) -> Analysis:
+    analysis = Analysis.objects.get(id=analysis_id)
+    existing = [line for line in analysis.suggestions.splitlines() if line.strip()]
+    existing_set = set(existing)
+    for line in ai_suggestions:
+        tagged = f"AI: {line}"
+        if tagged not in existing_set:
+            existing.append(tagged)
+    analysis.suggestions = "\n".join(existing)
+    analysis.save(update_fields=["suggestions", "updated_at"])
+    return analysis
+
+
+def append_ai_suggestions(analysis_id: int, payload: dict) -> None:
     try:
         from django.db import close_old_connections
         close_old_connections()
         ai_suggestions = _generate_ai_suggestions(payload)
         if not ai_suggestions:
             return
-        analysis = Analysis.objects.get(id=analysis_id)
-        existing = [line for line in analysis.suggestions.splitlines() if line.strip()]
-        existing_set = set(existing)
-        for line in ai_suggestions:
-            tagged = f"AI: {line}"
-            if tagged not in existing_set:
-                existing.append(tagged)
-        analysis.suggestions = "\n".join(existing)
-        analysis.save(update_fields=["suggestions"])
+        _merge_ai_suggestions(analysis_id, ai_suggestions)
     except Exception:
         logger.exception("AI async update failed.")
 
 
-def run_analysis(resume: Resume, job_description: str) -> Analysis:
+def _dispatch_ai_suggestions(analysis_id: int, payload: dict) -> None:
+    if AI_ASYNC_BACKEND == "celery":
+        from .tasks import append_ai_suggestions_task
+
+        # Survives web-worker recycles; the row must be committed before a worker reads it.
+        transaction.on_commit(lambda: append_ai_suggestions_task.delay(analysis_id, payload))
+        return
+    if not AI_POOL.submit(append_ai_suggestions, analysis_id, payload):
+        logger.warning("AI suggestion queue is full; skipping AI tips for analysis %s.", analysis_id)
+
+
+def _keyword_similarity(resume: Resume, resume_features: dict, jd_features: dict) -> float:
+    resume_vector = get_resume_keyword_vector(resume)
+    if resume_vector is None:
+        return processed_similarity_score(resume_features["processed"], jd_features["processed"])
+
+    jd_vector = KEYWORD_MODEL.vector(jd_features["processed"])
+    return max(0.0, min(stored_vector_dot(resume_vector, jd_vector) * 100, 100.0))
+
+
+def analysis_request_key(resume: Resume, job_description: str) -> str:
+    """Identify an analysis by its inputs and every version that can change its result."""
+    resume_hash = resume.content_hash or hashlib.sha256((resume.extracted_text or "").encode("utf-8")).hexdigest()
+    keyword_version = KEYWORD_MODEL.version if KEYWORD_MODEL.available() else ""
+    parts = (
+        resume_hash,
+        job_description_hash(job_description),
+        weights_version(),
+        features_version(),
+        model_version(),
+        keyword_version,
+    )
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_or_run_analysis(resume: Resume, job_description: str, defer_ai: bool = False) -> tuple[Analysis, bool]:
+    """Return `(analysis, created)`, reusing the stored analysis for an identical request.
+
+    Concurrent identical requests are coalesced with a short-lived lock in the Django cache
+    (`cache.add` is atomic): one request computes, the others wait for its row to appear.
+    With `defer_ai` no background AI job is started; the caller streams tips instead.
+    """
+    request_key = analysis_request_key(resume, job_description)
+    existing = _find_analysis(resume, request_key)
+    if existing is not None:
+        return existing, False
+
+    lock_key = f"analysis-lock:{request_key}"
+    if not cache.add(lock_key, 1, ANALYSIS_LOCK_TIMEOUT_SECONDS):
+        deadline = time.monotonic() + ANALYSIS_WAIT_SECONDS
+        while time.monotonic() < deadline and cache.get(lock_key) is not None:
+            time.sleep(ANALYSIS_POLL_SECONDS)
+            existing = _find_analysis(resume, request_key)
+            if existing is not None:
+                return existing, False
+        # The other request failed or is taking too long; compute it here instead.
+        existing = _find_analysis(resume, request_key)
+        if existing is not None:
+            return existing, False
+        return run_analysis(resume, job_description, request_key=request_key, defer_ai=defer_ai), True
+
+    try:
+        existing = _find_analysis(resume, request_key)
+        if existing is not None:
+            return existing, False
+        return run_analysis(resume, job_description, request_key=request_key, defer_ai=defer_ai), True
+    finally:
+        cache.delete(lock_key)
+
+
+def _find_analysis(resume: Resume, request_key: str) -> Analysis | None:
+    return Analysis.objects.filter(resume=resume, request_key=request_key).order_by("-created_at").first()
+
+
+def run_analysis(resume: Resume, job_description: str, request_key: str = "", defer_ai: bool = False) -> Analysis:
     resume_text = resume.extracted_text or ""
+    resume_features = get_resume_features(resume)
+    jd_features = job_description_features(job_description)
 
-    keyword_similarity = keyword_similarity_score(resume_text, job_description)
+    keyword_similarity = _keyword_similarity(resume, resume_features, jd_features)
 
-    resume_skills = extract_skills(resume_text)
-    jd_skills = extract_skills(job_description)
+    resume_skills = resume_features["skills"]
+    jd_skills = jd_features["skills"]
 
     if jd_skills:
         overlap = set(resume_skills).intersection(set(jd_skills))
@@ -118,30 +274,14 @@ def run_analysis(resume: Resume, job_description: str) -> Analysis:
         skill_match = 0.0
         missing = []
 
-    experience_relevance = experience_relevance_score(resume_text, job_description)
-    ats_compliance = ats_compliance_score(resume_text)
+    experience_relevance = years_relevance_score(resume_features["years"], jd_features["years"])
+    ats_compliance = resume_features["ats_compliance"]
 
-    final_score = (
-        keyword_similarity * 0.40
-        + skill_match * 0.30
-        + experience_relevance * 0.20
-        + ats_compliance * 0.10
-    )
+    final_score = combine_scores(keyword_similarity, skill_match, experience_relevance, ats_compliance)
 
     predicted_role = predict_role(resume_text)
     suggestions = generate_suggestions(missing, ats_compliance, experience_relevance)
 
-    ai_payload = {
-        "job_description": job_description or "",
-        "resume_excerpt": resume_text[:2000],
-        "match_score": round(final_score, 2),
-        "keyword_similarity": round(keyword_similarity, 2),
-        "skill_match_score": round(skill_match, 2),
-        "experience_relevance": round(experience_relevance, 2),
-        "ats_compliance": round(ats_compliance, 2),
-        "skills_missing": missing,
-        "predicted_role": predicted_role,
-    }
     analysis = Analysis.objects.create(
         resume=resume,
         job_description=job_description,
@@ -154,23 +294,24 @@ def run_analysis(resume: Resume, job_description: str) -> Analysis:
         skills_missing=missing,
         suggestions="\n".join(suggestions),
         predicted_role=predicted_role,
+        request_key=request_key,
     )
+    try:
+        record_analysis(analysis)
+    except Exception:
+        logger.exception("Daily analysis rollup update failed.")
 
     use_async = os.getenv("OPENAI_ASYNC", "true").lower() in {"1", "true", "yes"}
-    if _should_use_ai():
+    if _should_use_ai() and not defer_ai:
+        ai_payload = _ai_payload(analysis, resume_text)
         if use_async:
-            thread = threading.Thread(
-                target=_append_ai_suggestions_async,
-                args=(analysis.id, ai_payload),
-                daemon=True,
-            )
-            thread.start()
+            _dispatch_ai_suggestions(analysis.id, ai_payload)
         else:
             ai_suggestions = _generate_ai_suggestions(ai_payload)
             if ai_suggestions:
                 analysis.suggestions = "\n".join(
                     suggestions + [f"AI: {line}" for line in ai_suggestions]
                 )
-                analysis.save(update_fields=["suggestions"])
+                analysis.save(update_fields=["suggestions", "updated_at"])
 
     return analysis
@@ -0,0 +1,88 @@
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Analysis, AnalysisDailyStats
+
+HISTOGRAM_BUCKETS = 10
+
+
+def score_bucket(score: float) -> int:
+    """Index of the 10-point bucket a 0-100 score falls in; 100 goes in the last bucket."""
+    return min(max(int(score // (100 / HISTOGRAM_BUCKETS)), 0), HISTOGRAM_BUCKETS - 1)
+
+
+def record_analysis(analysis: Analysis):
+    """Fold one new analysis into its day's rollup row."""
+    day = timezone.localdate(analysis.created_at)
+    with transaction.atomic():
+        AnalysisDailyStats.objects.get_or_create(day=day)
+        stats = AnalysisDailyStats.objects.select_for_update().get(day=day)
+        histogram = stats.histogram or [0] * HISTOGRAM_BUCKETS
+        histogram[score_bucket(analysis.match_score)] += 1
+        role = analysis.predicted_role or ""
+        stats.analyses += 1
+        stats.score_sum += analysis.match_score
+        stats.histogram = histogram
+        stats.roles[role] = stats.roles.get(role, 0) + 1
+        stats.save()
+
+
+def rebuild_daily_stats(since: date | None = None) -> int:
+    """Recompute rollups from the analysis table (all days, or from `since` on). Returns days written."""
+    analyses = Analysis.objects.all()
+    if since is not None:
+        analyses = analyses.filter(created_at__date__gte=since)
+    analyses = analyses.annotate(day=TruncDate("created_at")).values("day")
+
+    bucket_counts = {f"bucket_{index}": Count("id", filter=_bucket_filter(index)) for index in range(HISTOGRAM_BUCKETS)}
+    rows = {}
+    for row in analyses.annotate(analyses=Count("id"), score_sum=Sum("match_score"), **bucket_counts).order_by("day"):
+        rows[row["day"]] = AnalysisDailyStats(
+            day=row["day"],
+            analyses=row["analyses"],
+            score_sum=row["score_sum"] or 0.0,
+            histogram=[row[f"bucket_{index}"] for index in range(HISTOGRAM_BUCKETS)],
+            roles={},
+        )
+    for row in analyses.annotate(count=Count("id")).values("day", "predicted_role", "count"):
+        rows[row["day"]].roles[row["predicted_role"] or ""] = row["count"]
+
+    with transaction.atomic():
+        stale = AnalysisDailyStats.objects.all()
+        if since is not None:
+            stale = stale.filter(day__gte=since)
+        stale.delete()
+        AnalysisDailyStats.objects.bulk_create(rows.values(), batch_size=500)
+    return len(rows)
+
+
+def _bucket_filter(index: int) -> Q:
+    width = 100 / HISTOGRAM_BUCKETS
+    condition = Q(match_score__gte=index * width)
+    if index < HISTOGRAM_BUCKETS - 1:
+        condition &= Q(match_score__lt=(index + 1) * width)
+    return condition
+
+
+def daily_stats_series(start: date, end: date) -> list[dict]:
+    """One entry per day in [start, end], read only from the rollup table; missing days are zeros."""
+    stored = {stats.day: stats for stats in AnalysisDailyStats.objects.filter(day__gte=start, day__lte=end)}
+    series = []
+    day = start
+    while day <= end:
+        stats = stored.get(day)
+        series.append(
+            {
+                "date": day.isoformat(),
+                "analyses": stats.analyses if stats else 0,
+                "average_match_score": stats.average_match_score if stats else 0.0,
+                "histogram": stats.histogram if stats else [0] * HISTOGRAM_BUCKETS,
+                "roles": stats.roles if stats else {},
+            }
+        )
+        day += timedelta(days=1)
+    return series
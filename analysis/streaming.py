@@ -0,0 +1,40 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+from .models import Analysis
+from .serializers import AnalysisSerializer
+from .services import stream_ai_suggestions
+
+
+def sse_event(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n".encode("utf-8")
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Lets `Accept: text/event-stream` pass content negotiation; errors are sent as an `error` event."""
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return b"" if data is None else sse_event("error", data)
+
+
+def analysis_events(analysis: Analysis):
+    """Server-Sent Events for one analysis: `analysis`, then one `suggestion` per AI tip, then `done`.
+
+    The deterministic result is sent before anything talks to the AI backend. If the row
+    already has AI tips (a background job or an earlier stream stored them) nothing is requested.
+    """
+    data = AnalysisSerializer(analysis).data
+    yield sse_event("analysis", data)
+
+    if not any(line.startswith("AI:") for line in data["suggestions_list"]):
+        for line in stream_ai_suggestions(analysis):
+            yield sse_event("suggestion", {"text": f"AI: {line}"})
+        analysis.refresh_from_db(fields=["suggestions", "updated_at"])
+
+    yield sse_event("done", {"id": analysis.id, "suggestions_list": AnalysisSerializer(analysis).data["suggestions_list"]})
@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from .services import append_ai_suggestions
+
+
+@shared_task(name="analysis.append_ai_suggestions")
+def append_ai_suggestions_task(analysis_id: int, payload: dict) -> None:
+    append_ai_suggestions(analysis_id, payload)
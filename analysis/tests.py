@@ -0,0 +1,340 @@
+import json
+import os
+import threading
+import time
+from unittest import SkipTest, mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from rest_framework.test import APITestCase
+
+from benchmarks.fake_responses_api import TIPS, FakeResponsesServer
+
+from . import ai
+from .ai import BoundedExecutor, get_client
+from resumes.models import Resume
+from users.models import User
+
+from .cache import AI_SUGGESTION_CACHE, AISuggestionCache
+from .models import Analysis
+from .services import _generate_ai_suggestions, _openai, _stream_ai_lines
+
+PAYLOAD = {
+    "job_description": "Backend engineer with python, django, kubernetes and terraform.",
+    "resume_excerpt": "Python developer, 5 years of Django and PostgreSQL.",
+    "match_score": 61.2,
+    "keyword_similarity": 40.0,
+    "skill_match_score": 50.0,
+    "experience_relevance": 100.0,
+    "ats_compliance": 80.0,
+    "skills_missing": ["kubernetes", "terraform"],
+    "predicted_role": "Backend Engineer",
+}
+
+
+class BoundedExecutorTests(SimpleTestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def _pool(self, max_workers: int, max_queue: int, queue_timeout: float = 0.0) -> BoundedExecutor:
+        pool = BoundedExecutor(max_workers, max_queue, queue_timeout, name="test")
+        # Cleanups run last-in first-out: do not wait here, the release event is only set after this.
+        self.addCleanup(pool.shutdown, False)
+        return pool
+
+    def test_sheds_jobs_beyond_workers_plus_queue(self):
+        pool = self._pool(max_workers=2, max_queue=3)
+
+        accepted = [pool.submit(self.release.wait) for _ in range(7)]
+
+        self.assertEqual(accepted, [True] * 5 + [False] * 2)
+        self.assertEqual(pool.stats()["shed"], 2)
+        self.release.set()
+        pool.shutdown(wait=True)
+        self.assertEqual(pool.stats()["completed"], 5)
+
+    def test_queue_timeout_waits_for_a_free_slot(self):
+        pool = self._pool(max_workers=1, max_queue=0, queue_timeout=2.0)
+        pool.submit(time.sleep, 0.2)
+
+        started = time.monotonic()
+        accepted = pool.submit(time.sleep, 0)
+
+        self.assertTrue(accepted)
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+        self.assertEqual(pool.stats()["shed"], 0)
+
+    def test_queue_timeout_sheds_when_no_slot_frees_up(self):
+        pool = self._pool(max_workers=1, max_queue=0, queue_timeout=0.2)
+        pool.submit(self.release.wait)
+
+        started = time.monotonic()
+        accepted = pool.submit(self.release.wait)
+
+        self.assertFalse(accepted)
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertEqual(pool.stats()["shed"], 1)
+
+    def test_stats_report_queue_depth_and_latency(self):
+        pool = self._pool(max_workers=1, max_queue=4)
+        running = threading.Event()
+
+        def job():
+            running.set()
+            self.release.wait()
+
+        pool.submit(job)
+        running.wait(2)
+        for _ in range(3):
+            pool.submit(time.sleep, 0.01)
+
+        stats = pool.stats()
+        self.assertEqual((stats["running"], stats["queue_depth"], stats["submitted"]), (1, 3, 4))
+
+        time.sleep(0.05)
+        self.release.set()
+        pool.shutdown(wait=True)
+        stats = pool.stats()
+        self.assertEqual((stats["running"], stats["queue_depth"], stats["completed"]), (0, 0, 4))
+        self.assertGreaterEqual(stats["queue_wait_ms"]["max"], 50)
+        self.assertGreaterEqual(stats["run_ms"]["max"], 50)
+        self.assertLessEqual(stats["run_ms"]["p50"], stats["run_ms"]["p95"])
+
+    def test_failed_jobs_are_counted_and_release_their_slot(self):
+        pool = self._pool(max_workers=1, max_queue=0)
+
+        with self.assertLogs("analysis.ai", "ERROR"):
+            pool.submit(lambda: 1 / 0)
+            pool.shutdown(wait=True)
+
+        self.assertEqual(pool.stats()["failed"], 1)
+        self.assertTrue(pool.submit(time.sleep, 0))
+
+    def test_after_fork_starts_with_an_empty_pool_and_fresh_counters(self):
+        pool = self._pool(max_workers=1, max_queue=0)
+        pool.submit(time.sleep, 0)
+        pool.shutdown(wait=True)
+        pool.submit(self.release.wait)
+        self.assertFalse(pool.submit(time.sleep, 0))
+
+        pool._after_fork()
+
+        stats = pool.stats()
+        self.assertEqual(
+            {name: stats[name] for name in ("submitted", "shed", "completed", "failed", "queue_depth", "running")},
+            dict.fromkeys(("submitted", "shed", "completed", "failed", "queue_depth", "running"), 0),
+        )
+        self.assertEqual(stats["queue_wait_ms"], {"p50": 0.0, "p95": 0.0, "max": 0.0})
+        self.assertEqual(stats["run_ms"], {"p50": 0.0, "p95": 0.0, "max": 0.0})
+        self.assertTrue(pool.submit(time.sleep, 0))
+
+
+class AISuggestionCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.cache = AISuggestionCache(maxsize=8, timeout=60, wait_timeout=2)
+        self.calls = 0
+
+    def _compute(self, lines=("Tip one.", "Tip two.")):
+        self.calls += 1
+        return list(lines)
+
+    def test_repeated_prompt_is_served_from_cache(self):
+        first = self.cache.get_or_compute("prompt", "model", self._compute)
+        second = self.cache.get_or_compute("prompt", "model", self._compute)
+        other_model = self.cache.get_or_compute("prompt", "other-model", self._compute)
+
+        self.assertEqual(first, second)
+        self.assertEqual(other_model, first)
+        self.assertEqual(self.calls, 2)
+        stats = self.cache.stats()
+        self.assertEqual((stats["local_hits"], stats["upstream_calls"], stats["upstream_calls_saved"]), (1, 2, 1))
+
+    def test_failed_calls_are_not_cached(self):
+        self.cache.get_or_compute("prompt", "model", lambda: self._compute(()))
+        self.cache.get_or_compute("prompt", "model", self._compute)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_concurrent_identical_calls_share_one_upstream_call(self):
+        started, release = threading.Event(), threading.Event()
+        results = []
+
+        def slow_compute():
+            started.set()
+            release.wait(2)
+            return self._compute()
+
+        owner = threading.Thread(target=lambda: results.append(self.cache.get_or_compute("prompt", "model", slow_compute)))
+        owner.start()
+        started.wait(2)
+        waiter = threading.Thread(target=lambda: results.append(self.cache.get_or_compute("prompt", "model", slow_compute)))
+        waiter.start()
+        time.sleep(0.05)
+        release.set()
+        owner.join(2)
+        waiter.join(2)
+
+        self.assertEqual(results, [["Tip one.", "Tip two."]] * 2)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.cache.stats()["coalesced"], 1)
+
+    def test_entries_expire_after_timeout(self):
+        self.cache = AISuggestionCache(maxsize=8, timeout=1, wait_timeout=1)
+        self.cache.get_or_compute("prompt", "model", self._compute)
+
+        time.sleep(1.1)
+        self.cache.get_or_compute("prompt", "model", self._compute)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_lock_held_by_another_worker_is_not_released(self):
+        self.cache = AISuggestionCache(maxsize=8, timeout=60, wait_timeout=0.2)
+        lock_key = f"{self.cache.key('prompt', 'model')}:lock"
+        cache.add(lock_key, 1, 30)
+
+        lines = self.cache.get_or_compute("prompt", "model", self._compute)
+
+        self.assertEqual((lines, self.calls), (["Tip one.", "Tip two."], 1))
+        self.assertEqual(cache.get(lock_key), 1)
+
+
+class FakeResponsesMixin:
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.openai = _openai()
+        if cls.openai is None:
+            raise SkipTest("openai is not installed")
+        cls.server = FakeResponsesServer(latency=0.01).start()
+        cls.other_server = FakeResponsesServer(latency=0.01).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.other_server.shutdown()
+        super().tearDownClass()
+
+    def setUp(self):
+        env = mock.patch.dict(
+            os.environ,
+            {"OPENAI_API_KEY": "local-test", "OPENAI_API_BASE": self.server.base_url, "OPENAI_TIMEOUT_SECONDS": "5"},
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        ai._reset_client()
+        self.addCleanup(ai._reset_client)
+        AI_SUGGESTION_CACHE.clear()
+        self.addCleanup(AI_SUGGESTION_CACHE.clear)
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.server.requests = self.server.connections = 0
+        self.other_server.requests = 0
+
+
+class ResponsesClientTests(FakeResponsesMixin, SimpleTestCase):
+    def test_client_is_reused_and_keeps_its_connection(self):
+        client = get_client(self.openai)
+        for _ in range(3):
+            get_client(self.openai).responses.create(model="local", input="hello", max_output_tokens=20)
+
+        self.assertIs(get_client(self.openai), client)
+        self.assertEqual(self.server.requests, 3)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_client_is_rebuilt_when_config_changes(self):
+        client = get_client(self.openai)
+
+        with mock.patch.dict(os.environ, {"OPENAI_API_BASE": self.other_server.base_url}):
+            rebuilt = get_client(self.openai)
+            rebuilt.responses.create(model="local", input="hello", max_output_tokens=20)
+
+        self.assertIsNot(rebuilt, client)
+        self.assertEqual((self.server.requests, self.other_server.requests), (0, 1))
+
+    def test_generate_ai_suggestions_returns_tip_lines(self):
+        self.assertEqual(_generate_ai_suggestions(PAYLOAD), list(TIPS))
+        self.assertEqual(self.server.requests, 1)
+
+    def test_streamed_tips_include_the_last_line_and_stop_at_six(self):
+        many = tuple(f"Tip number {index}." for index in range(1, 9))
+
+        self.assertEqual(list(_stream_ai_lines(self.openai, "prompt", "local")), list(TIPS))
+        with mock.patch("benchmarks.fake_responses_api.TIPS", many[:6]):
+            self.assertEqual(list(_stream_ai_lines(self.openai, "prompt", "local")), list(many[:6]))
+        with mock.patch("benchmarks.fake_responses_api.TIPS", many):
+            self.assertEqual(list(_stream_ai_lines(self.openai, "prompt", "local")), list(many[:6]))
+
+    def test_pool_jobs_share_the_client_connections(self):
+        pool = BoundedExecutor(2, 8, name="test")
+        results = []
+        for index in range(6):
+            payload = dict(PAYLOAD, job_description=f"{PAYLOAD['job_description']} #{index}")
+            pool.submit(lambda payload=payload: results.append(_generate_ai_suggestions(payload)))
+        pool.shutdown(wait=True)
+
+        self.assertEqual(results, [list(TIPS)] * 6)
+        self.assertEqual(self.server.requests, 6)
+        self.assertLessEqual(self.server.connections, 2)
+
+
+def read_events(response) -> list[tuple[str, dict]]:
+    events = []
+    for block in b"".join(response.streaming_content).decode("utf-8").split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class AnalysisStreamTests(FakeResponsesMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(email="stream@example.com", password="pw")
+        self.client.force_authenticate(self.user)
+        resume = Resume.objects.create(user=self.user, file="resumes/stream.pdf", extracted_text=PAYLOAD["resume_excerpt"])
+        self.analysis = Analysis.objects.create(
+            resume=resume,
+            job_description=PAYLOAD["job_description"],
+            match_score=PAYLOAD["match_score"],
+            skills_missing=PAYLOAD["skills_missing"],
+            suggestions="Add or strengthen these missing skills: kubernetes, terraform",
+            predicted_role=PAYLOAD["predicted_role"],
+        )
+
+    def _stream(self):
+        response = self.client.get(
+            f"/api/resume/analyses/{self.analysis.id}/stream/", HTTP_ACCEPT="text/event-stream"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        return read_events(response)
+
+    def test_stream_sends_analysis_then_tips_then_done(self):
+        events = self._stream()
+
+        names = [name for name, _ in events]
+        self.assertEqual(names, ["analysis"] + ["suggestion"] * len(TIPS) + ["done"])
+        self.assertEqual(events[0][1]["id"], self.analysis.id)
+        self.assertEqual([data["text"] for name, data in events if name == "suggestion"], [f"AI: {tip}" for tip in TIPS])
+        self.assertEqual(events[-1][1]["suggestions_list"][-len(TIPS):], [f"AI: {tip}" for tip in TIPS])
+        self.assertEqual(self.server.requests, 1)
+
+    def test_reopened_stream_replays_saved_tips_without_upstream_call(self):
+        self._stream()
+        AI_SUGGESTION_CACHE.clear()
+        cache.clear()
+
+        events = self._stream()
+
+        self.assertEqual([name for name, _ in events], ["analysis", "done"])
+        self.assertEqual(events[0][1]["suggestions_list"][-len(TIPS):], [f"AI: {tip}" for tip in TIPS])
+        self.assertEqual(self.server.requests, 1)
+
+    def test_missing_analysis_is_reported_as_an_error_event(self):
+        response = self.client.get("/api/resume/analyses/999999/stream/", HTTP_ACCEPT="text/event-stream")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertTrue(response.content.startswith(b"event: error"))
@@ -0,0 +1,100 @@
+import argparse
+import logging
+import os
+import threading
+import time
+
+import django
+
+from benchmarks.fake_responses_api import FakeResponsesServer
+
+PAYLOAD = {
+    "job_description": "Backend engineer with python, django, kubernetes and terraform.",
+    "resume_excerpt": "Python developer, 5 years of Django and PostgreSQL.",
+    "match_score": 61.2,
+    "keyword_similarity": 40.0,
+    "skill_match_score": 50.0,
+    "experience_relevance": 100.0,
+    "ats_compliance": 80.0,
+    "skills_missing": ["kubernetes", "terraform"],
+    "predicted_role": "Backend Engineer",
+}
+
+
+def _thread_per_request(count: int) -> float:
+    # The previous behaviour: one unbounded thread and one fresh client per analysis.
+    import openai
+
+    from analysis.services import _build_ai_prompt
+
+    def job(payload):
+        client = openai.OpenAI(
+            api_key=os.environ["OPENAI_API_KEY"], base_url=os.environ["OPENAI_API_BASE"], max_retries=0, timeout=30
+        )
+        client.responses.create(model="local", input=_build_ai_prompt(payload), max_output_tokens=220)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=job, args=(_payload(index),), daemon=True) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def _payload(index: int) -> dict:
+    # A distinct prompt per job, so the suggestion cache cannot coalesce the calls being measured.
+    return dict(PAYLOAD, job_description=f"{PAYLOAD['job_description']} (posting {index})")
+
+
+def _bounded_pool(generate, pool, count: int) -> tuple[float, int]:
+    started = time.perf_counter()
+    accepted = sum(pool.submit(generate, _payload(index)) for index in range(count))
+    pool.shutdown(wait=True)
+    return time.perf_counter() - started, accepted
+
+
+def run(count: int, latency: float, workers: int, queue: int):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resume_analyzer.settings")
+    django.setup()
+    for name in ("httpx", "httpx2"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    from analysis import ai
+    from analysis.ai import BoundedExecutor
+    from analysis.cache import AI_SUGGESTION_CACHE
+    from analysis.services import _generate_ai_suggestions
+
+    server = FakeResponsesServer(latency=latency).start()
+    os.environ["OPENAI_API_KEY"] = "local-test"
+    os.environ["OPENAI_API_BASE"] = server.base_url
+    print(f"{count} analyses, stand-in latency {latency * 1000:.0f} ms")
+
+    elapsed = _thread_per_request(count)
+    print(f"  thread per analysis (before)  {elapsed:>6.2f}s  threads {count:>4}  connections {server.connections:>4}")
+
+    server.connections = server.requests = 0
+    ai._reset_client()
+    AI_SUGGESTION_CACHE.clear()
+    os.environ["OPENAI_TIMEOUT_SECONDS"] = "30"
+    pool = BoundedExecutor(workers, queue, name="bench")
+    elapsed, accepted = _bounded_pool(_generate_ai_suggestions, pool, count)
+    stats = pool.stats()
+    print(
+        f"  bounded pool ({workers}+{queue})         {elapsed:>6.2f}s  threads {workers:>4}  connections {server.connections:>4}"
+        f"  accepted {accepted}  shed {stats['shed']}"
+    )
+    print(f"  queue wait ms {stats['queue_wait_ms']}  run ms {stats['run_ms']}  upstream requests {server.requests}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare thread-per-analysis AI calls with the bounded pool.")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue", type=int, default=32)
+    args = parser.parse_args()
+    run(args.count, args.latency, args.workers, args.queue)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import csv
+import time
+from pathlib import Path
+
+from utils.nlp import _build_document, clean_text, load_pipeline
+
+DATASET = Path(__file__).resolve().parents[1] / "ml" / "training" / "sample_dataset.csv"
+
+
+def _load_texts(count: int) -> list[str]:
+    with open(DATASET, "r", encoding="utf-8") as file:
+        rows = [row["text"] for row in csv.DictReader(file)]
+    texts = []
+    while len(texts) < count:
+        # Stitch rows together so each sample is roughly resume-sized.
+        start = len(texts) % len(rows)
+        texts.append(" ".join(rows[(start + i) % len(rows)] for i in range(12)))
+    return texts
+
+
+def _report(label: str, elapsed: float, count: int):
+    print(f"{label:<36} {elapsed / count * 1000:>9.2f} ms/doc {count / elapsed:>9.1f} docs/s")
+
+
+def run(count: int, batch_size: int, n_process: int):
+    texts = _load_texts(count)
+
+    full = load_pipeline("full")
+    print(f"Documents: {count}  pipeline components (full): {full.pipe_names if full else 'none'}")
+
+    started = time.perf_counter()
+    for text in texts:
+        cleaned = clean_text(text)
+        # The pre-batching path ran spaCy twice per document.
+        full(cleaned)
+        _build_document(text, cleaned, full(cleaned))
+    _report("full pipeline, 2 passes per doc", time.perf_counter() - started, count)
+
+    for profile in ("full", "lean"):
+        pipeline = load_pipeline(profile)
+
+        started = time.perf_counter()
+        for text in texts:
+            cleaned = clean_text(text)
+            _build_document(text, cleaned, pipeline(cleaned))
+        _report(f"{profile} pipeline, per doc", time.perf_counter() - started, count)
+
+        started = time.perf_counter()
+        cleaned = [clean_text(text) for text in texts]
+        docs = pipeline.pipe(cleaned, batch_size=batch_size, n_process=n_process)
+        for text, clean, doc in zip(texts, cleaned, docs):
+            _build_document(text, clean, doc)
+        _report(f"{profile} pipeline, nlp.pipe", time.perf_counter() - started, count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark spaCy pipeline profiles and batched parsing")
+    parser.add_argument("--count", type=int, default=500, help="Number of synthetic documents")
+    parser.add_argument("--batch-size", type=int, default=64, help="nlp.pipe batch size")
+    parser.add_argument("--n-process", type=int, default=1, help="nlp.pipe worker processes")
+    args = parser.parse_args()
+
+    run(args.count, args.batch_size, args.n_process)
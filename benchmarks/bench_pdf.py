@@ -0,0 +1,76 @@
+import argparse
+import time
+
+import pdfplumber
+
+from resumes.parsers import _extract_pdf_text
+
+LINE = "Senior backend engineer with 6 years of Python, Django, PostgreSQL and AWS experience building APIs"
+
+
+def build_pdf(pages: int, lines_per_page: int = 45) -> bytes:
+    """Write a minimal multi-page PDF with a Helvetica text layer (no external tools needed)."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(pages):
+        rows = [f"({LINE} - page {page + 1} line {line + 1}) Tj T*" for line in range(lines_per_page)]
+        stream = "BT /F1 9 Tf 11 TL 36 806 Td " + " ".join(rows) + " ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        content_id = len(objects)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def _sequential_pdfplumber(data: bytes) -> str:
+    # The original extractor: every page, in order, layout-aware.
+    import io
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        return "\n".join(page.extract_text() or "" for page in pdf.pages).strip()
+
+
+def _time(label: str, func, repeat: int):
+    func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        text = func()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"  {label:<34} {elapsed * 1000:>9.1f} ms  {len(text):>7} chars")
+
+
+def run(page_counts: list[int], repeat: int, workers: int):
+    for pages in page_counts:
+        data = build_pdf(pages)
+        print(f"{pages} page(s), {len(data) / 1024:.0f} KiB")
+        _time("pdfplumber sequential (before)", lambda: _sequential_pdfplumber(data), repeat)
+        _time("layout, sequential", lambda: _extract_pdf_text(data, mode="layout", workers=0), repeat)
+        _time(f"layout, {workers} workers", lambda: _extract_pdf_text(data, mode="layout", workers=workers), repeat)
+        _time("fast text layer", lambda: _extract_pdf_text(data, mode="fast", workers=0), repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF text extraction modes.")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5, 30])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    run(args.pages, args.repeat, args.workers)
+
+
+if __name__ == "__main__":
+    main()
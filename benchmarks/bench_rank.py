@@ -0,0 +1,71 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from analysis.scoring import combine_scores, score_resumes
+from benchmarks.bench_nlp import _load_texts
+from ml.keywords import KeywordModel, fit_keyword_vectorizer, stored_vector_dot
+from utils.nlp import document_features, parse_documents, years_relevance_score
+
+JOB_DESCRIPTION = (
+    "Backend engineer with 5+ years of experience in python, django, postgres, docker and kubernetes. "
+    "Experience with rest api design, microservices and aws is a plus."
+)
+
+
+def _build_features(base_count: int, total: int, model: KeywordModel) -> list[dict]:
+    documents = parse_documents(_load_texts(base_count))
+    base = [document_features(document, include_ats=True) for document in documents]
+    for features, document in zip(base, documents):
+        features["years"] = len(document.tokens) % 9
+        features["keyword_vector"] = model.vector(features["processed"])
+    return [base[position % len(base)] for position in range(total)]
+
+
+def _score_one_by_one(resume_features: list[dict], model: KeywordModel) -> list[float]:
+    # Mirrors the per-request path: JD features and vector rebuilt for every resume.
+    scores = []
+    for features in resume_features:
+        jd_features = document_features(JOB_DESCRIPTION)
+        jd_vector = model.vector(jd_features["processed"])
+        keyword = max(0.0, min(stored_vector_dot(features["keyword_vector"], jd_vector) * 100, 100.0))
+        jd_skills = set(jd_features["skills"])
+        skill = len(jd_skills & set(features["skills"])) / len(jd_skills) * 100 if jd_skills else 0.0
+        experience = years_relevance_score(features["years"], jd_features["years"])
+        scores.append(combine_scores(keyword, skill, experience, features["ats_compliance"]))
+    return scores
+
+
+def run(sizes: list[int], base_count: int):
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "keyword_vectorizer.pkl"
+        corpus = [document.processed for document in parse_documents(_load_texts(base_count))]
+        fit_keyword_vectorizer(corpus, path=path)
+        model = KeywordModel(path)
+
+        for size in sizes:
+            resume_features = _build_features(base_count, size, model)
+
+            started = time.perf_counter()
+            _score_one_by_one(resume_features, model)
+            loop_elapsed = time.perf_counter() - started
+
+            started = time.perf_counter()
+            jd_features = document_features(JOB_DESCRIPTION)
+            score_resumes(resume_features, jd_features, model)
+            batch_elapsed = time.perf_counter() - started
+
+            print(
+                f"{size:>6} resumes  per-resume {loop_elapsed * 1000:>9.1f} ms ({size / loop_elapsed:>9.0f}/s)  "
+                f"batched {batch_elapsed * 1000:>8.1f} ms ({size / batch_elapsed:>9.0f}/s)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark one-JD-against-N-resumes ranking throughput")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--base-count", type=int, default=200, help="Distinct synthetic resumes to parse")
+    args = parser.parse_args()
+
+    run(args.sizes, args.base_count)
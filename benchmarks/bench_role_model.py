@@ -0,0 +1,67 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SKLEARN_PATH = (
+    "from ml.services import RoleModel; "
+    "model = RoleModel(mmap=False); model.predict(['python django docker'])"
+)
+COMPACT_PATH = (
+    "from pathlib import Path; from ml.services import CompactRoleModel; "
+    "model = CompactRoleModel(Path({path!r})); model.predict(['python django docker'])"
+)
+
+
+def _time_process(code: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-W", "ignore", "-c", code], cwd=ROOT, check=True)
+    return time.perf_counter() - started
+
+
+def _time_predictions(model, texts: list[str]) -> float:
+    started = time.perf_counter()
+    model.predict(texts)
+    return time.perf_counter() - started
+
+
+def run(repeat: int):
+    import csv
+
+    import joblib
+
+    from ml.services import ENCODER_PATH, MODEL_PATH, VECTORIZER_PATH, CompactRoleModel, RoleModel, export_compact_model
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = export_compact_model(
+            joblib.load(MODEL_PATH), joblib.load(VECTORIZER_PATH), joblib.load(ENCODER_PATH), Path(directory) / "compact.npz"
+        )
+        if path is None:
+            print("Trained model is not linear; nothing to compare.")
+            return
+
+        for label, code in (("sklearn pickles", SKLEARN_PATH), ("compact .npz", COMPACT_PATH.format(path=str(path)))):
+            timings = [_time_process(code) for _ in range(repeat)]
+            print(f"{label:<16} import+load+predict  median {statistics.median(timings) * 1000:>7.0f} ms")
+
+        with open(ROOT / "ml" / "training" / "sample_dataset.csv", "r", encoding="utf-8") as file:
+            texts = [row["text"] for row in csv.DictReader(file)]
+        sklearn_model, compact_model = RoleModel(mmap=False), CompactRoleModel(path)
+        agree = sklearn_model.predict(texts) == compact_model.predict(texts)
+        for label, model in (("sklearn pickles", sklearn_model), ("compact .npz", compact_model)):
+            elapsed = _time_predictions(model, texts)
+            print(f"{label:<16} {len(texts)} predictions  {elapsed * 1000:>7.0f} ms")
+        print(f"Identical predictions: {agree}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the sklearn and compact NumPy role-model scorers")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.repeat)
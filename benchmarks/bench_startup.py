@@ -0,0 +1,48 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+WORKER_BOOT = (
+    "import django; django.setup(); "
+    "from resume_analyzer.celery import app; app.loader.import_default_modules(); "
+    "import analysis.services"
+)
+
+COMMANDS = {
+    "manage.py check": [sys.executable, "manage.py", "check"],
+    "worker boot (no warmup)": [sys.executable, "-c", WORKER_BOOT],
+    "worker boot + warmup()": [sys.executable, "-c", WORKER_BOOT + "; from utils.nlp import warmup; warmup()"],
+}
+
+
+def _time_command(command: list[str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        command,
+        cwd=ROOT,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "resume_analyzer.settings"},
+    )
+    return time.perf_counter() - started
+
+
+def run(repeat: int):
+    for label, command in COMMANDS.items():
+        timings = [_time_command(command) for _ in range(repeat)]
+        print(f"{label:<28} median {statistics.median(timings):.2f}s  min {min(timings):.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure process startup time for management commands and workers")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command")
+    args = parser.parse_args()
+
+    run(args.repeat)
@@ -0,0 +1,70 @@
+import argparse
+import gc
+import multiprocessing
+import tempfile
+from pathlib import Path
+
+from ml.services import ENCODER_PATH, MODEL_PATH, VECTORIZER_PATH, RoleModel, export_bundle
+
+SAMPLE_TEXTS = ["python django rest api postgres docker", "react typescript css accessibility"]
+
+
+def _memory_kb() -> dict:
+    usage = {}
+    for source in ("/proc/self/status", "/proc/self/smaps_rollup"):
+        with open(source, "r", encoding="utf-8") as file:
+            for line in file:
+                key, _, value = line.partition(":")
+                if key in {"VmRSS", "Pss"}:
+                    usage[key] = int(value.split()[0])
+    return usage
+
+
+def _worker(model, bundle_path, mmap, queue):
+    if model is None:
+        model = RoleModel(bundle_path=bundle_path, mmap=mmap)
+    model.predict(SAMPLE_TEXTS)
+    queue.put(_memory_kb())
+
+
+def _measure(workers: int, mmap: bool, preload: bool, bundle_path: Path) -> list[dict]:
+    context = multiprocessing.get_context("fork")
+    model = None
+    if preload:
+        model = RoleModel(bundle_path=bundle_path, mmap=mmap)
+        model.predict(SAMPLE_TEXTS)
+        gc.freeze()
+
+    queue = context.Queue()
+    processes = [context.Process(target=_worker, args=(model, bundle_path, mmap, queue)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    usage = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+    gc.unfreeze()
+    return usage
+
+
+def run(workers: int):
+    import joblib
+
+    with tempfile.TemporaryDirectory() as directory:
+        bundle_path = export_bundle(
+            joblib.load(MODEL_PATH), joblib.load(VECTORIZER_PATH), joblib.load(ENCODER_PATH), Path(directory) / "role_model.joblib"
+        )
+        for mmap in (False, True):
+            for preload in (False, True):
+                usage = _measure(workers, mmap, preload, bundle_path)
+                rss = sum(item["VmRSS"] for item in usage) / len(usage) / 1024
+                pss = sum(item["Pss"] for item in usage) / len(usage) / 1024
+                label = f"{'mmap bundle' if mmap else 'pickles'}, {'preloaded' if preload else 'per-worker load'}"
+                print(f"{label:<32} per-worker RSS {rss:>7.1f} MB  PSS {pss:>7.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-worker memory for role-model loading modes")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    run(args.workers)
@@ -0,0 +1,131 @@
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TIPS = (
+    "Add measurable outcomes to your recent backend projects.",
+    "Mention Kubernetes and Terraform explicitly if you have used them.",
+    "Move the skills section above education for ATS parsers.",
+    "Quantify the scale of the APIs you built (requests per day, latency).",
+)
+
+
+class FakeResponsesServer(ThreadingHTTPServer):
+    """Local stand-in for `POST /v1/responses`, for exercising AI code paths without the real API.
+
+    Point the app at it with `OPENAI_API_BASE=http://127.0.0.1:<port>/v1` and any
+    `OPENAI_API_KEY`. Counts requests and TCP connections so connection reuse is visible.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address=("127.0.0.1", 0), latency: float = 0.2):
+        super().__init__(address, _Handler)
+        self.latency = latency
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def count(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def start(self) -> "FakeResponsesServer":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.count("connections")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path.rstrip("/") != "/v1/responses":
+            self._send(404, {"error": {"message": "not found"}})
+            return
+        self.server.count("requests")
+        request = json.loads(body or b"{}")
+        time.sleep(self.server.latency)
+        if request.get("stream"):
+            self._stream(request)
+            return
+        self._send(200, _response(request, "\n".join(TIPS)))
+
+    def _stream(self, request):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        text = "\n".join(TIPS)
+        events = [{"type": "response.created", "response": _response(request, "", status="in_progress")}]
+        for token in text.split(" "):
+            events.append({"type": "response.output_text.delta", "item_id": "msg_1", "output_index": 0, "content_index": 0, "delta": token + " "})
+        events.append({"type": "response.completed", "response": _response(request, text)})
+        for sequence, event in enumerate(events):
+            event["sequence_number"] = sequence
+            self._chunk(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode("utf-8"))
+            time.sleep(self.server.latency / len(events))
+        self._chunk(b"")
+
+    def _chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send(self, status: int, payload: dict):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _response(request: dict, text: str, status: str = "completed") -> dict:
+    return {
+        "id": "resp_local",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": status,
+        "model": request.get("model", "local"),
+        "output": [
+            {
+                "type": "message",
+                "id": "msg_1",
+                "status": status,
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the OpenAI Responses API.")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+    server = FakeResponsesServer(("127.0.0.1", args.port), latency=args.latency)
+    print(f"Serving fake Responses API at {server.base_url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import gc
+import logging
+import os
+
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+# More than one thread switches to gthread workers, so open analysis streams do not pin a whole worker.
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+# Load the app (and warm up NLP + role model) in the master so workers share those pages.
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() in {"1", "true", "yes"}
+
+logger = logging.getLogger("gunicorn.error")
+
+
+def _memory_kb() -> dict:
+    usage = {}
+    for source in ("/proc/self/status", "/proc/self/smaps_rollup"):
+        try:
+            with open(source, "r", encoding="utf-8") as file:
+                for line in file:
+                    key, _, value = line.partition(":")
+                    if key in {"VmRSS", "Pss", "Shared_Clean", "Shared_Dirty"}:
+                        usage[key] = int(value.split()[0])
+        except OSError:
+            continue
+    return usage
+
+
+def when_ready(server):
+    # Keep the collector from writing to preloaded objects and un-sharing their pages.
+    gc.freeze()
+    logger.info("Master memory after preload: %s", _memory_kb())
+
+
+def post_worker_init(worker):
+    logger.info("Worker %s memory: %s", worker.pid, _memory_kb())
@@ -0,0 +1,99 @@
+import csv
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .services import ARTIFACT_DIR, BASE_DIR
+
+KEYWORD_VECTORIZER_PATH = ARTIFACT_DIR / "keyword_vectorizer.pkl"
+SAMPLE_DATASET_PATH = BASE_DIR / "training" / "sample_dataset.csv"
+MAX_FEATURES = int(os.getenv("KEYWORD_MAX_FEATURES", "50000"))
+
+
+class KeywordModel:
+    """Corpus-fitted TF-IDF vectorizer, loaded once and reloaded when the artifact changes."""
+
+    def __init__(self, path: Path = KEYWORD_VECTORIZER_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._vectorizer = None
+        self.version = ""
+
+    def available(self) -> bool:
+        return self._load() is not None
+
+    def transform(self, processed_texts: list[str]):
+        vectorizer = self._load()
+        if vectorizer is None:
+            raise RuntimeError("Keyword vectorizer has not been fitted. Run `manage.py refit_keyword_vectorizer`.")
+        return vectorizer.transform(processed_texts)
+
+    @property
+    def n_features(self) -> int:
+        vectorizer = self._load()
+        return len(vectorizer.vocabulary_) if vectorizer is not None else 0
+
+    def vector(self, processed_text: str) -> dict:
+        return to_stored_vector(self.transform([processed_text]), self.version)
+
+    def _load(self):
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if self._vectorizer is not None and mtime == self._mtime:
+            return self._vectorizer
+        with self._lock:
+            if self._vectorizer is None or mtime != self._mtime:
+                import joblib
+
+                artifact = joblib.load(self.path)
+                self._vectorizer = artifact["vectorizer"]
+                self.version = artifact["version"]
+                self._mtime = mtime
+        return self._vectorizer
+
+
+KEYWORD_MODEL = KeywordModel()
+
+
+def to_stored_vector(matrix, version: str) -> dict:
+    row = matrix.tocsr()[0]
+    return {
+        "version": version,
+        "indices": row.indices.tolist(),
+        "data": [round(float(value), 6) for value in row.data],
+    }
+
+
+def stored_vector_dot(left: dict, right: dict) -> float:
+    if not left["indices"] or not right["indices"]:
+        return 0.0
+    left_weights = dict(zip(left["indices"], left["data"]))
+    return float(sum(left_weights.get(index, 0.0) * value for index, value in zip(right["indices"], right["data"])))
+
+
+def fit_keyword_vectorizer(processed_texts: list[str], path: Path = KEYWORD_VECTORIZER_PATH) -> str:
+    import joblib
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(max_features=MAX_FEATURES, dtype=np.float32)
+    vectorizer.fit([text for text in processed_texts if text])
+    version = f"{int(time.time())}:{len(vectorizer.vocabulary_)}"
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    joblib.dump({"vectorizer": vectorizer, "version": version}, tmp_path)
+    os.replace(tmp_path, path)
+    return version
+
+
+def sample_dataset_texts(path: Path = SAMPLE_DATASET_PATH) -> list[str]:
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as file:
+        return [row["text"] for row in csv.DictReader(file) if row.get("text")]
@@ -0,0 +1,30 @@
+import joblib
+from django.core.management.base import BaseCommand
+
+from ml.services import (
+    BUNDLE_PATH,
+    COMPACT_PATH,
+    ENCODER_PATH,
+    MODEL_PATH,
+    VECTORIZER_PATH,
+    export_bundle,
+    export_compact_model,
+)
+
+
+class Command(BaseCommand):
+    help = "Export the role-model pickles as a memory-mappable joblib bundle and a NumPy-only compact bundle."
+
+    def handle(self, *args, **options):
+        model = joblib.load(MODEL_PATH)
+        vectorizer = joblib.load(VECTORIZER_PATH)
+        encoder = joblib.load(ENCODER_PATH)
+
+        compact_path = export_compact_model(model, vectorizer, encoder, COMPACT_PATH)
+        if compact_path:
+            self.stdout.write(self.style.SUCCESS(f"Wrote {compact_path}. Set ML_COMPACT_MODEL=True to serve it."))
+        else:
+            self.stdout.write(self.style.WARNING("Model is not linear; compact bundle not exported."))
+
+        export_bundle(model, vectorizer, encoder, BUNDLE_PATH)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {BUNDLE_PATH}. Set ML_MMAP_ARTIFACTS=True to load it memory-mapped."))
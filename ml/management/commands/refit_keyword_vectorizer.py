@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+
+from ml.keywords import KEYWORD_MODEL, KEYWORD_VECTORIZER_PATH, fit_keyword_vectorizer, sample_dataset_texts
+from resumes.models import Resume
+from resumes.services import refresh_keyword_vectors
+from utils.nlp import features_version, parse_documents
+
+
+class Command(BaseCommand):
+    help = "Fit the keyword-similarity TF-IDF model on stored resumes plus the sample dataset."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--no-dataset", action="store_true", help="Skip ml/training/sample_dataset.csv")
+        parser.add_argument("--max-resumes", type=int, default=None, help="Cap on stored resumes used for fitting")
+        parser.add_argument(
+            "--skip-revectorize",
+            action="store_true",
+            help="Do not refresh stored resume vectors now; they are recomputed lazily on next use",
+        )
+
+    def handle(self, *args, **options):
+        version = features_version()
+        queryset = Resume.objects.order_by("-uploaded_at").only("id", "extracted_text", "features", "features_version")
+        if options["max_resumes"]:
+            queryset = queryset[: options["max_resumes"]]
+
+        corpus = []
+        stale_texts = []
+        for resume in queryset.iterator(chunk_size=500):
+            if resume.features_version == version and resume.features.get("processed"):
+                corpus.append(resume.features["processed"])
+            elif resume.extracted_text:
+                stale_texts.append(resume.extracted_text)
+        resume_count = len(corpus) + len(stale_texts)
+
+        extra_texts = [] if options["no_dataset"] else sample_dataset_texts()
+        corpus.extend(document.processed for document in parse_documents(stale_texts + extra_texts))
+
+        if not corpus:
+            self.stdout.write(self.style.WARNING("No documents available to fit the keyword vectorizer."))
+            return
+
+        model_version = fit_keyword_vectorizer(corpus)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Fitted keyword vectorizer {model_version} on {resume_count} resumes "
+                f"and {len(extra_texts)} dataset rows -> {KEYWORD_VECTORIZER_PATH}"
+            )
+        )
+
+        if not options["skip_revectorize"] and KEYWORD_MODEL.available():
+            updated = refresh_keyword_vectors(Resume.objects.filter(features_version=version).order_by("id"))
+            self.stdout.write(self.style.SUCCESS(f"Refreshed keyword vectors for {updated} resumes."))
@@ -1,21 +1,393 @@
+import hashlib
+import os
+import re
+import threading
 from pathlib import Path
-import joblib
 
 BASE_DIR = Path(__file__).resolve().parent
 ARTIFACT_DIR = BASE_DIR / "artifacts"
 MODEL_PATH = ARTIFACT_DIR / "role_classifier.pkl"
 VECTORIZER_PATH = ARTIFACT_DIR / "tfidf_vectorizer.pkl"
 ENCODER_PATH = ARTIFACT_DIR / "label_encoder.pkl"
+BUNDLE_PATH = ARTIFACT_DIR / "role_model.joblib"
+COMPACT_PATH = ARTIFACT_DIR / "role_model_compact.npz"
+UNTRAINED_LABEL = "Model not trained"
+MMAP_ARTIFACTS = os.getenv("ML_MMAP_ARTIFACTS", "false").lower() in {"1", "true", "yes"}
+COMPACT_ARTIFACTS = os.getenv("ML_COMPACT_MODEL", "false").lower() in {"1", "true", "yes"}
+
+
+class RoleModel:
+    """Role classifier artifacts loaded once per process and reloaded when the files change on disk.
+
+    With `mmap=True` and an exported bundle on disk, numeric arrays are memory-mapped
+    read-only so every worker forked from the same parent shares the same pages.
+    """
+
+    def __init__(
+        self,
+        model_path: Path = MODEL_PATH,
+        vectorizer_path: Path = VECTORIZER_PATH,
+        encoder_path: Path = ENCODER_PATH,
+        bundle_path: Path = BUNDLE_PATH,
+        mmap: bool = MMAP_ARTIFACTS,
+    ):
+        self.pickle_paths = (model_path, vectorizer_path, encoder_path)
+        self.bundle_path = bundle_path
+        self.mmap = mmap
+        self._lock = threading.Lock()
+        self._signature = None
+        self._artifacts = None
+
+    @property
+    def paths(self) -> tuple:
+        if self.mmap and self.bundle_path.exists():
+            return (self.bundle_path,)
+        return self.pickle_paths
+
+    def available(self) -> bool:
+        return self._load() is not None
+
+    def version(self) -> str:
+        return _signature_version("sk", self._current_signature())
+
+    def predict(self, texts: list[str]) -> list[str]:
+        artifacts = self._load()
+        if artifacts is None:
+            return [UNTRAINED_LABEL] * len(texts)
+        if not texts:
+            return []
+
+        model, vectorizer, encoder = artifacts
+        preds = model.predict(vectorizer.transform(texts))
+        return [str(label) for label in encoder.inverse_transform(preds)]
+
+    def predict_top_k(self, texts: list[str], k: int = 3) -> list[list[tuple[str, float]]]:
+        artifacts = self._load()
+        if artifacts is None:
+            return [[(UNTRAINED_LABEL, 0.0)] for _ in texts]
+        if not texts:
+            return []
+
+        model, vectorizer, encoder = artifacts
+        if not hasattr(model, "predict_proba"):
+            return [[(label, 1.0)] for label in self.predict(texts)]
+
+        probabilities = model.predict_proba(vectorizer.transform(texts))
+        labels = [str(label) for label in encoder.inverse_transform(model.classes_)]
+        k = min(k, len(labels))
+        results = []
+        for row in probabilities:
+            top = row.argsort()[::-1][:k]
+            results.append([(labels[index], round(float(row[index]), 4)) for index in top])
+        return results
+
+    def _current_signature(self):
+        try:
+            return tuple((path.stat().st_mtime_ns, path.stat().st_size) for path in self.paths)
+        except FileNotFoundError:
+            return None
+
+    def _load(self):
+        signature = self._current_signature()
+        if signature is None:
+            return None
+        if self._artifacts is not None and signature == self._signature:
+            return self._artifacts
+        with self._lock:
+            if self._artifacts is None or signature != self._signature:
+                import joblib
+
+                paths = self.paths
+                if paths == (self.bundle_path,):
+                    bundle = joblib.load(self.bundle_path, mmap_mode="r")
+                    self._artifacts = (bundle["model"], bundle["vectorizer"], bundle["encoder"])
+                else:
+                    self._artifacts = tuple(joblib.load(path) for path in paths)
+                self._signature = signature
+        return self._artifacts
+
+
+class CompactRoleModel:
+    """Pure-NumPy scorer for linear role models exported with `export_compact_model`.
+
+    Reproduces TfidfVectorizer (word n-grams, sublinear tf, idf, l2 norm) and the linear
+    decision function without importing scikit-learn or unpickling anything.
+    """
+
+    def __init__(self, path: Path = COMPACT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature = None
+        self._arrays = None
+
+    def available(self) -> bool:
+        return self._load() is not None
+
+    def version(self) -> str:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return _signature_version("np", None)
+        return _signature_version("np", ((stat.st_mtime_ns, stat.st_size),))
+
+    def predict(self, texts: list[str]) -> list[str]:
+        arrays = self._load()
+        if arrays is None:
+            return [UNTRAINED_LABEL] * len(texts)
+
+        labels = arrays["labels"]
+        predictions = []
+        for scores in self._decision(arrays, texts):
+            if arrays["kind"] == "ovo":
+                predictions.append(str(labels[self._ovo_votes(scores, len(labels)).argmax()]))
+            elif scores.shape[0] == 1:
+                predictions.append(str(labels[int(scores[0] > 0)]))
+            else:
+                predictions.append(str(labels[scores.argmax()]))
+        return predictions
+
+    def predict_top_k(self, texts: list[str], k: int = 3) -> list[list[tuple[str, float]]]:
+        arrays = self._load()
+        if arrays is None:
+            return [[(UNTRAINED_LABEL, 0.0)] for _ in texts]
+        if arrays["proba"] == "none":
+            return [[(label, 1.0)] for label in self.predict(texts)]
+
+        import numpy as np
+
+        labels = arrays["labels"]
+        k = min(k, len(labels))
+        results = []
+        for scores in self._decision(arrays, texts):
+            if arrays["proba"] == "softmax":
+                exp = np.exp(scores - scores.max())
+                probabilities = exp / exp.sum()
+            elif scores.shape[0] == 1:
+                positive = 1 / (1 + np.exp(-scores[0]))
+                probabilities = np.array([1 - positive, positive])
+            else:
+                sigmoid = 1 / (1 + np.exp(-scores))
+                probabilities = sigmoid / sigmoid.sum()
+            top = probabilities.argsort()[::-1][:k]
+            results.append([(str(labels[index]), round(float(probabilities[index]), 4)) for index in top])
+        return results
+
+    def _decision(self, arrays: dict, texts: list[str]):
+        import numpy as np
+
+        terms, columns, idf = arrays["terms"], arrays["columns"], arrays["idf"]
+        coef, intercept = arrays["coef"], arrays["intercept"]
+        # Casting to the vocabulary's fixed-width dtype would truncate longer n-grams into false matches.
+        max_length = terms.dtype.itemsize // 4
+        for text in texts:
+            grams = [gram for gram in self._ngrams(arrays, text) if len(gram) <= max_length]
+            grams, counts = np.unique(np.array(grams, dtype=terms.dtype), return_counts=True)
+            positions = np.searchsorted(terms, grams)
+            positions[positions >= len(terms)] = 0
+            known = terms[positions] == grams if len(terms) else np.zeros(len(grams), dtype=bool)
+            feature_columns = columns[positions[known]]
+            weights = counts[known].astype(np.float64)
+            if arrays["sublinear_tf"]:
+                weights = 1 + np.log(weights)
+            weights *= idf[feature_columns]
+            norm = np.sqrt((weights**2).sum())
+            if norm > 0:
+                weights /= norm
+            yield coef[:, feature_columns] @ weights + intercept
+
+    @staticmethod
+    def _ngrams(arrays: dict, text: str) -> list[str]:
+        if arrays["lowercase"]:
+            text = text.lower()
+        tokens = arrays["token_pattern"].findall(text)
+        min_n, max_n = arrays["ngram_range"]
+        grams = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            grams.extend(" ".join(tokens[i : i + n]) for i in range(len(tokens) - n + 1))
+        return grams
+
+    @staticmethod
+    def _ovo_votes(scores, n_classes: int):
+        import numpy as np
+
+        votes = np.zeros(n_classes, dtype=np.int64)
+        pair = 0
+        for first in range(n_classes):
+            for second in range(first + 1, n_classes):
+                votes[first if scores[pair] > 0 else second] += 1
+                pair += 1
+        return votes
+
+    def _load(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._arrays is not None and signature == self._signature:
+            return self._arrays
+        with self._lock:
+            if self._arrays is None or signature != self._signature:
+                import numpy as np
+
+                with np.load(self.path, allow_pickle=False) as bundle:
+                    self._arrays = {
+                        "terms": bundle["terms"],
+                        "columns": bundle["columns"],
+                        "idf": bundle["idf"],
+                        "coef": bundle["coef"],
+                        "intercept": bundle["intercept"],
+                        "labels": bundle["labels"],
+                        "kind": str(bundle["kind"]),
+                        "proba": str(bundle["proba"]),
+                        "ngram_range": tuple(int(n) for n in bundle["ngram_range"]),
+                        "sublinear_tf": bool(bundle["sublinear_tf"]),
+                        "lowercase": bool(bundle["lowercase"]),
+                        "token_pattern": re.compile(str(bundle["token_pattern"])),
+                    }
+                self._signature = signature
+        return self._arrays
+
+
+ROLE_MODEL = CompactRoleModel() if COMPACT_ARTIFACTS and COMPACT_PATH.exists() else RoleModel()
+
+
+def export_bundle(model, vectorizer, encoder, path: Path = BUNDLE_PATH) -> Path:
+    import joblib
+
+    # stop_words_ only records terms pruned during fitting and is not needed to transform.
+    if hasattr(vectorizer, "stop_words_"):
+        vectorizer.stop_words_ = None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    joblib.dump({"model": model, "vectorizer": vectorizer, "encoder": encoder}, tmp_path, compress=0)
+    os.replace(tmp_path, path)
+    return path
+
+
+def warmup() -> bool:
+    return ROLE_MODEL.available()
+
+
+def model_version() -> str:
+    """Cheap stamp of the role-model artifacts on disk (no load), for keying cached results."""
+    return ROLE_MODEL.version()
+
+
+def predict_roles(texts: list[str]) -> list[str]:
+    return ROLE_MODEL.predict(list(texts))
+
+
+def predict_roles_top_k(texts: list[str], k: int = 3) -> list[list[tuple[str, float]]]:
+    return ROLE_MODEL.predict_top_k(list(texts), k=k)
+
+
+def predict_role_top_k(text: str, k: int = 3) -> list[tuple[str, float]]:
+    return predict_roles_top_k([text], k=k)[0]
 
 
 def predict_role(text: str) -> str:
-    if not MODEL_PATH.exists() or not VECTORIZER_PATH.exists() or not ENCODER_PATH.exists():
-        return "Model not trained"
+    return predict_roles([text])[0]
+
+
+def export_compact_model(model, vectorizer, encoder, path: Path = COMPACT_PATH) -> Path | None:
+    """Export a linear classifier plus its TF-IDF vectorizer as a NumPy-only `.npz` bundle.
+
+    Returns None when the model or vectorizer configuration cannot be reproduced exactly.
+    """
+    import numpy as np
+
+    params = vectorizer.get_params()
+    supported_vectorizer = (
+        params["analyzer"] == "word"
+        and params["tokenizer"] is None
+        and params["preprocessor"] is None
+        and params["stop_words"] is None
+        and params["strip_accents"] is None
+        and not params["binary"]
+        and params["use_idf"]
+        and params["norm"] == "l2"
+    )
+    if not supported_vectorizer or not hasattr(model, "coef_") or not hasattr(model, "intercept_"):
+        return None
+
+    coef = model.coef_.toarray() if hasattr(model.coef_, "toarray") else np.asarray(model.coef_)
+    n_classes = len(model.classes_)
+    kind = "ovo" if type(model).__name__ in {"SVC", "NuSVC"} and n_classes > 2 else "linear"
+
+    vocabulary = vectorizer.vocabulary_
+    terms = np.array(sorted(vocabulary))
+    columns = np.array([vocabulary[term] for term in terms], dtype=np.int64)
+    labels = np.array([str(label) for label in encoder.inverse_transform(model.classes_)])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        path,
+        terms=terms,
+        columns=columns,
+        idf=np.asarray(vectorizer.idf_, dtype=np.float64),
+        coef=coef.astype(np.float64),
+        intercept=np.asarray(model.intercept_, dtype=np.float64),
+        labels=labels,
+        kind=np.array(kind),
+        proba=np.array(_probability_mode(model, vectorizer, kind, terms)),
+        ngram_range=np.array(params["ngram_range"]),
+        sublinear_tf=np.array(params["sublinear_tf"]),
+        lowercase=np.array(params["lowercase"]),
+        token_pattern=np.array(params["token_pattern"]),
+    )
+
+    compact = CompactRoleModel(path)
+    probe = [" ".join(terms[i :: 7][:40]) for i in range(7)]
+    # Over-long n-grams that share a prefix with the longest term must not count as that term.
+    longest = max(terms, key=len) if len(terms) else ""
+    probe.append(f"{longest}zzzz {longest} {longest}zzzz")
+    expected = [str(label) for label in encoder.inverse_transform(model.predict(vectorizer.transform(probe)))]
+    if compact.predict(probe) != expected or not _decisions_match(compact, model, vectorizer, kind, probe):
+        path.unlink()
+        return None
+    return path
+
+
+def _decisions_match(compact, model, vectorizer, kind: str, texts: list[str]) -> bool:
+    import numpy as np
+
+    if kind != "linear" or not hasattr(model, "decision_function"):
+        return True
+    scores = np.array(list(compact._decision(compact._load(), texts))).reshape(len(texts), -1)
+    expected = np.asarray(model.decision_function(vectorizer.transform(texts))).reshape(len(texts), -1)
+    return bool(np.allclose(scores, expected))
+
+
+def _signature_version(prefix: str, signature) -> str:
+    if signature is None:
+        return "untrained"
+    digest = hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()[:12]
+    return f"{prefix}:{digest}"
+
+
+def _probability_mode(model, vectorizer, kind: str, terms) -> str:
+    import numpy as np
+
+    if kind != "linear" or not hasattr(model, "predict_proba") or not hasattr(model, "decision_function"):
+        return "none"
 
-    model = joblib.load(MODEL_PATH)
-    vectorizer = joblib.load(VECTORIZER_PATH)
-    encoder = joblib.load(ENCODER_PATH)
+    probe = vectorizer.transform([" ".join(terms[i :: 5][:40]) for i in range(5)])
+    try:
+        expected = model.predict_proba(probe)
+    except Exception:
+        return "none"
+    scores = np.atleast_2d(model.decision_function(probe))
+    if scores.shape[0] != expected.shape[0]:
+        scores = scores.T
 
-    X = vectorizer.transform([text])
-    pred = model.predict(X)[0]
-    return str(encoder.inverse_transform([pred])[0])
+    exp = np.exp(scores - scores.max(axis=1, keepdims=True))
+    if scores.shape[1] > 1 and np.allclose(exp / exp.sum(axis=1, keepdims=True), expected, atol=1e-6):
+        return "softmax"
+    sigmoid = 1 / (1 + np.exp(-scores))
+    if scores.shape[1] == 1:
+        if np.allclose(np.hstack([1 - sigmoid, sigmoid]), expected, atol=1e-6):
+            return "ovr"
+    elif np.allclose(sigmoid / sigmoid.sum(axis=1, keepdims=True), expected, atol=1e-6):
+        return "ovr"
+    return "none"
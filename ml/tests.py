@@ -0,0 +1,60 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from django.test import SimpleTestCase
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import LabelEncoder
+
+from .services import CompactRoleModel, export_compact_model
+
+TRAINING = (
+    ("high availability applications maintaining kubernetes clusters and terraform", "DevOps Engineer"),
+    ("availability applications maintaining uptime with prometheus alerts", "DevOps Engineer"),
+    ("python django rest apis with postgres and celery workers", "Backend Engineer"),
+    ("building django services and postgres migrations in python", "Backend Engineer"),
+    ("react typescript frontend components with css modules", "Frontend Engineer"),
+    ("accessible react interfaces and typescript design systems", "Frontend Engineer"),
+)
+
+
+class CompactRoleModelParityTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        texts, roles = zip(*TRAINING)
+        cls.encoder = LabelEncoder()
+        labels = cls.encoder.fit_transform(roles)
+        cls.vectorizer = TfidfVectorizer(ngram_range=(1, 3), sublinear_tf=True)
+        cls.model = LogisticRegression(max_iter=1000).fit(cls.vectorizer.fit_transform(texts), labels)
+        cls.directory = tempfile.TemporaryDirectory()
+        path = export_compact_model(cls.model, cls.vectorizer, cls.encoder, Path(cls.directory.name) / "compact.npz")
+        if path is None:
+            raise AssertionError("export_compact_model rejected the model: compact scores differ from sklearn")
+        cls.compact = CompactRoleModel(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+        super().tearDownClass()
+
+    def test_over_long_ngrams_do_not_match_truncated_terms(self):
+        longest = max(self.vectorizer.vocabulary_, key=len)
+        texts = [
+            f"{longest}zzzz python",
+            "availability applications maintainingzzzz react",
+            f"{longest} {longest}zzzz {longest}zzzzzzzz",
+        ]
+
+        scores = np.array(list(self.compact._decision(self.compact._load(), texts)))
+        expected = self.model.decision_function(self.vectorizer.transform(texts))
+
+        np.testing.assert_allclose(scores, expected)
+
+    def test_predictions_match_sklearn_pipeline(self):
+        texts = [text for text, _ in TRAINING] + ["kubernetes and django", "", "unrelated words only"]
+
+        expected = list(self.encoder.inverse_transform(self.model.predict(self.vectorizer.transform(texts))))
+
+        self.assertEqual(self.compact.predict(texts), expected)
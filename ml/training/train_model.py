@@ -1,4 +1,5 @@
 import argparse
+import sys
 from pathlib import Path
 
 import joblib
@@ -23,6 +24,9 @@ from sklearn.preprocessing import LabelEncoder
 from sklearn.svm import SVC
 from sklearn.tree import DecisionTreeClassifier
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ml.services import export_bundle, export_compact_model  # noqa: E402
+
 MODEL_RATIONALE = {
     "logreg": "Strong linear baseline for sparse text; stable and interpretable coefficients with probabilistic outputs.",
     "svm": "Effective margin-based classifier for text data, especially in high-dimensional TF-IDF spaces.",
@@ -229,6 +233,8 @@ def train(input_csv: Path, artifact_dir: Path):
     joblib.dump(model, artifact_dir / "role_classifier.pkl")
     joblib.dump(vectorizer, artifact_dir / "tfidf_vectorizer.pkl")
     joblib.dump(encoder, artifact_dir / "label_encoder.pkl")
+    export_bundle(model, vectorizer, encoder, artifact_dir / "role_model.joblib")
+    compact_path = export_compact_model(model, vectorizer, encoder, artifact_dir / "role_model_compact.npz")
     results_df.to_csv(artifact_dir / "model_comparison.csv", index=False)
 
     selected_row = results_df.iloc[0]
@@ -240,6 +246,7 @@ def train(input_csv: Path, artifact_dir: Path):
     print(f"Train accuracy: {selected_row['train_accuracy']:.2%}")
     print(f"Validation accuracy: {selected_row['test_accuracy']:.2%}")
     print(f"Validation macro F1: {selected_row['f1_macro']:.2%}")
+    print(f"Compact bundle: {compact_path or 'not exported (model is not linear)'}")
     print(f"Comparison CSV: {artifact_dir / 'model_comparison.csv'}")
     print(f"Comparison Report: {artifact_dir / 'model_comparison.md'}")
 
@@ -1,7 +1,18 @@
 import os
 from celery import Celery
+from celery.signals import worker_init
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resume_analyzer.settings")
 app = Celery("resume_analyzer")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+def warmup_models(**kwargs):
+    if os.getenv("NLP_WARMUP", "true").lower() in {"1", "true", "yes"}:
+        from ml.services import warmup as warmup_ml
+        from utils.nlp import warmup
+
+        warmup()
+        warmup_ml()
@@ -24,6 +24,7 @@ urlpatterns = [
     path("api/auth/", include("users.urls")),
     path("api/resume/", include("resumes.urls")),
     path("api/admin/", include("analysis.admin_urls")),
+    path("api/jobs/", include("analysis.job_urls")),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
 ]
@@ -3,3 +3,10 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resume_analyzer.settings")
 application = get_wsgi_application()
+
+if os.getenv("NLP_WARMUP", "true").lower() in {"1", "true", "yes"}:
+    from ml.services import warmup as warmup_ml
+    from utils.nlp import warmup
+
+    warmup()
+    warmup_ml()
@@ -1,9 +1,16 @@
 from django.contrib import admin
 
-from .models import Resume
+from .models import Resume, ResumeBatch
 
 
 @admin.register(Resume)
 class ResumeAdmin(admin.ModelAdmin):
-    list_display = ("id", "user", "uploaded_at")
-    search_fields = ("user__email",)
+    list_display = ("id", "user", "status", "parse_reused", "uploaded_at")
+    search_fields = ("user__email", "content_hash")
+
+
+@admin.register(ResumeBatch)
+class ResumeBatchAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "archive_name", "status", "processed", "total", "created_at")
+    list_filter = ("status",)
+    search_fields = ("user__email", "archive_name")
@@ -0,0 +1,166 @@
+import hashlib
+import multiprocessing
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from rest_framework.exceptions import ValidationError
+
+from .models import Resume, ResumeBatch
+from .parsers import extract_text_from_resume
+from .services import compute_features_batch, copy_parsed_resume, find_parsed_duplicate
+from .validators import MAX_FILE_SIZE_MB, validate_resume_name_and_size
+
+BULK_MAX_ENTRIES = int(os.getenv("BULK_MAX_ENTRIES", "500"))
+BULK_PARSE_WORKERS = int(os.getenv("BULK_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+BULK_FLUSH_SIZE = int(os.getenv("BULK_FLUSH_SIZE", "25"))
+
+
+def archive_entries(archive: zipfile.ZipFile) -> list[tuple[zipfile.ZipInfo, str]]:
+    entries = []
+    for info in archive.infolist():
+        name = PurePosixPath(info.filename).name
+        if info.is_dir() or info.filename.startswith("__MACOSX/") or not name or name.startswith("."):
+            continue
+        entries.append((info, name))
+    return entries
+
+
+def ingest_archive(batch: ResumeBatch, source) -> ResumeBatch:
+    """Create resumes for every valid entry of a ZIP archive, updating `batch` progress as it goes.
+
+    Entries are read one at a time from the archive (nothing is extracted to disk), parsed on a
+    process pool with a bounded number in flight, and inserted with `bulk_create` every
+    BULK_FLUSH_SIZE files. Per-file outcomes are collected in `batch.results`.
+    """
+    with zipfile.ZipFile(source) as archive:
+        entries = archive_entries(archive)
+        batch.status = ResumeBatch.STATUS_PROCESSING
+        batch.total = len(entries)
+        if len(entries) > BULK_MAX_ENTRIES:
+            batch.status = ResumeBatch.STATUS_FAILED
+            batch.error = f"Archive has {len(entries)} files; the limit is {BULK_MAX_ENTRIES}"
+            batch.save(update_fields=["status", "total", "error", "updated_at"])
+            return batch
+        batch.save(update_fields=["status", "total", "updated_at"])
+
+        ingest = _BatchWriter(batch)
+        pool = _parse_pool(BULK_PARSE_WORKERS)
+        in_flight = deque()
+        try:
+            for info, name in entries:
+                entry = _read_entry(archive, info, name, ingest)
+                if entry is None:
+                    continue
+                data, file_hash = entry
+                duplicate = find_parsed_duplicate(file_hash)
+                future = None if duplicate else _submit(pool, data, name)
+                in_flight.append((name, data, file_hash, duplicate, future))
+                while len(in_flight) > max(BULK_PARSE_WORKERS, 1) * 2:
+                    ingest.stage(*in_flight.popleft())
+            while in_flight:
+                ingest.stage(*in_flight.popleft())
+            ingest.flush()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    batch.status = ResumeBatch.STATUS_COMPLETED
+    batch.save(update_fields=["status", "updated_at"])
+    return batch
+
+
+def _read_entry(archive, info, name, ingest):
+    try:
+        validate_resume_name_and_size(name, info.file_size)
+        limit = MAX_FILE_SIZE_MB * 1024 * 1024
+        with archive.open(info) as entry:
+            # Header sizes can lie; never read more than the per-file limit.
+            data = entry.read(limit + 1)
+        if len(data) > limit:
+            raise ValidationError(f"File size must be <= {MAX_FILE_SIZE_MB}MB")
+    except ValidationError as exc:
+        ingest.record({"file": name, "status": "rejected", "error": _error_text(exc)})
+        return None
+    except (zipfile.BadZipFile, RuntimeError, OSError) as exc:
+        ingest.record({"file": name, "status": "failed", "error": f"Could not read entry: {exc}"})
+        return None
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def _parse_pool(workers: int):
+    # Celery prefork children are daemonic and cannot start their own processes; parse inline there.
+    if workers <= 1 or multiprocessing.current_process().daemon:
+        return None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _submit(pool, data: bytes, name: str) -> Future:
+    if pool is not None:
+        return pool.submit(extract_text_from_resume, data, name, 1)
+    future = Future()
+    try:
+        future.set_result(extract_text_from_resume(data, name, pdf_workers=1))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def _error_text(exc: ValidationError) -> str:
+    detail = exc.detail
+    return str(detail[0] if isinstance(detail, list) and detail else detail)
+
+
+class _BatchWriter:
+    def __init__(self, batch: ResumeBatch):
+        self.batch = batch
+        self.staged = []
+
+    def record(self, result: dict, save: bool = True):
+        self.batch.results.append(result)
+        self.batch.processed += 1
+        if result["status"] == "created":
+            self.batch.succeeded += 1
+        else:
+            self.batch.failed += 1
+        if save:
+            self._save_progress()
+
+    def stage(self, name, data, file_hash, duplicate, future):
+        resume = Resume(user_id=self.batch.user_id, content_hash=file_hash)
+        if duplicate is not None:
+            copy_parsed_resume(resume, duplicate, share_file=settings.RESUME_DEDUP_SHARED_STORAGE)
+        else:
+            try:
+                resume.extracted_text = future.result()
+            except Exception as exc:
+                self.record({"file": name, "status": "failed", "error": f"Could not parse file: {exc}"})
+                return
+        if not resume.file:
+            resume.file = ContentFile(data, name=name)
+        self.staged.append((name, resume))
+        if len(self.staged) >= BULK_FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if not self.staged:
+            return
+        resumes = [resume for _, resume in self.staged]
+        parsed = [resume for resume in resumes if not resume.parse_reused]
+        if parsed:
+            compute_features_batch(parsed)
+        Resume.objects.bulk_create(resumes, batch_size=BULK_FLUSH_SIZE)
+        for name, resume in self.staged:
+            self.record(
+                {"file": name, "status": "created", "resume_id": resume.id, "deduplicated": resume.parse_reused},
+                save=False,
+            )
+        self.staged = []
+        self._save_progress()
+
+    def _save_progress(self):
+        self.batch.save(update_fields=["processed", "succeeded", "failed", "results", "updated_at"])
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from resumes.models import Resume
+from resumes.services import refresh_resume_features
+from utils.nlp import features_version
+
+
+class Command(BaseCommand):
+    help = "Backfill or refresh precomputed resume features when the feature version changes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Recompute every resume, not just stale ones")
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    def handle(self, *args, **options):
+        version = features_version()
+        queryset = Resume.objects.order_by("id")
+        if not options["all"]:
+            queryset = queryset.exclude(features_version=version)
+
+        updated = refresh_resume_features(queryset, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Refreshed features for {updated} resumes (version {version})."))
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resumes", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="features",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="features_version",
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resumes", "0002_resume_features"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="status",
+            field=models.CharField(
+                choices=[("pending", "Pending"), ("parsed", "Parsed"), ("failed", "Failed")],
+                db_index=True,
+                default="parsed",
+                max_length=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="parse_error",
+            field=models.TextField(blank=True),
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resumes", "0003_resume_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="content_hash",
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="parse_reused",
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -2,9 +2,24 @@ from django.db import models
 
 
 class Resume(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_PARSED = "parsed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Pending"),
+        (STATUS_PARSED, "Parsed"),
+        (STATUS_FAILED, "Failed"),
+    )
+
     user = models.ForeignKey("users.User", on_delete=models.CASCADE, related_name="resumes", db_index=True)
     file = models.FileField(upload_to="resumes/%Y/%m/%d/")
     extracted_text = models.TextField(blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PARSED, db_index=True)
+    parse_error = models.TextField(blank=True)
+    features = models.JSONField(default=dict, blank=True)
+    features_version = models.CharField(max_length=64, blank=True, db_index=True)
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    parse_reused = models.BooleanField(default=False)
     uploaded_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     class Meta:
@@ -12,3 +27,35 @@ class Resume(models.Model):
 
     def __str__(self):
         return f"Resume {self.id} - {self.user.email}"
+
+
+class ResumeBatch(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_PROCESSING = "processing"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Pending"),
+        (STATUS_PROCESSING, "Processing"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    user = models.ForeignKey("users.User", on_delete=models.CASCADE, related_name="resume_batches", db_index=True)
+    archive = models.FileField(upload_to="resume_batches/%Y/%m/%d/", blank=True)
+    archive_name = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    succeeded = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    results = models.JSONField(default=list, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"ResumeBatch {self.id} - {self.archive_name}"
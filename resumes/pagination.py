@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class HistoryPagination(CursorPagination):
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_paginated_response(self, data, summary=None):
+        payload = {"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data}
+        if summary is not None:
+            payload["summary"] = summary
+        return Response(payload)
@@ -1,23 +1,230 @@
+import io
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from xml.etree import ElementTree
+
 import pdfplumber
-from docx import Document
+
+logger = logging.getLogger(__name__)
+
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "30"))
+PDF_TIME_BUDGET_SECONDS = float(os.getenv("PDF_TIME_BUDGET_SECONDS", "20"))
+PDF_TEXT_MODE = os.getenv("PDF_TEXT_MODE", "layout")
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "4"))
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_P, W_T, W_TAB, W_BR, W_CR, W_TBL = (f"{W_NS}{name}" for name in ("p", "t", "tab", "br", "cr", "tbl"))
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+DOCX_HEADER_PATTERN = re.compile(r"word/header(\d*)\.xml$")
+DOCX_FOOTER_PATTERN = re.compile(r"word/footer(\d*)\.xml$")
+
+_pool = None
+_pool_lock = threading.Lock()
 
 
-def extract_text_from_resume(file_path: str) -> str:
-    if file_path.lower().endswith(".pdf"):
-        return _extract_pdf_text(file_path)
-    if file_path.lower().endswith(".docx"):
-        return _extract_docx_text(file_path)
+def extract_text_from_resume(source, name: str | None = None, pdf_workers: int = PDF_WORKERS) -> str:
+    """Extract text from a path, raw bytes, or a file-like object such as an `UploadedFile`.
+
+    The format is taken from `name`, falling back to the path or the file object's `.name`.
+    File objects are read in memory and rewound afterwards so they can still be saved to storage.
+    """
+    name = (name or getattr(source, "name", None) or str(source)).lower()
+    if name.endswith(".pdf"):
+        return _extract_pdf_text(_read_source(source), workers=pdf_workers)
+    if name.endswith(".docx"):
+        return _extract_docx_text(_read_source(source))
     return ""
 
 
-def _extract_pdf_text(file_path: str) -> str:
+def _read_source(source):
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return source
+    source.seek(0)
+    try:
+        return source.read()
+    finally:
+        source.seek(0)
+
+
+def _extract_pdf_text(
+    source,
+    mode: str = PDF_TEXT_MODE,
+    max_pages: int = PDF_MAX_PAGES,
+    time_budget: float = PDF_TIME_BUDGET_SECONDS,
+    workers: int = PDF_WORKERS,
+) -> str:
+    """Extract PDF text within a page cap and a wall-clock budget.
+
+    `mode="layout"` uses pdfplumber's layout-aware extraction; `mode="fast"` reads the
+    raw text layer through pdfium. Documents with at least PDF_PARALLEL_MIN_PAGES pages
+    are split into page ranges and extracted on a process pool when workers > 1. Pages
+    not finished within the budget are dropped and the partial text is returned. The budget
+    is checked between pages, so a single slow page can still overrun it.
+    """
+    deadline = time.monotonic() + time_budget
+    total_pages = _pdf_page_count(source)
+    page_count = min(total_pages, max_pages)
+    if total_pages > max_pages:
+        logger.warning("PDF has %s pages; extracting only the first %s (PDF_MAX_PAGES).", total_pages, max_pages)
+
+    if workers > 1 and page_count >= PDF_PARALLEL_MIN_PAGES:
+        pages = _extract_pdf_pages_parallel(source, page_count, mode, deadline, workers)
+    else:
+        pages = _extract_pdf_pages(source, 0, page_count, mode, deadline)
+
+    if len(pages) < page_count:
+        logger.warning("PDF extraction stopped at %s of %s pages (time budget %.1fs).", len(pages), page_count, time_budget)
+    return "\n".join(pages).strip()
+
+
+def _pdf_page_count(source) -> int:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(source)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def _extract_pdf_pages(source, start: int, stop: int, mode: str, deadline: float | None = None) -> list[str]:
+    if mode == "fast":
+        return _extract_pdf_pages_fast(source, start, stop, deadline)
+
     content = []
-    with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
+    with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        for page in pdf.pages[start:stop]:
+            if deadline is not None and time.monotonic() > deadline:
+                break
             content.append(page.extract_text() or "")
-    return "\n".join(content).strip()
+            page.close()
+    return content
+
+
+def _extract_pdf_pages_fast(source, start: int, stop: int, deadline: float | None = None) -> list[str]:
+    import pypdfium2 as pdfium
+
+    content = []
+    pdf = pdfium.PdfDocument(source)
+    try:
+        for index in range(start, stop):
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            page = pdf[index]
+            textpage = page.get_textpage()
+            content.append(textpage.get_text_range().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return content
+
+
+def _extract_pdf_pages_parallel(source, page_count: int, mode: str, deadline: float, workers: int) -> list[str]:
+    pool = _get_pool(workers)
+    ranges = [(start, min(start + PDF_PAGES_PER_TASK, page_count)) for start in range(0, page_count, PDF_PAGES_PER_TASK)]
+    pages = []
+    try:
+        # Workers get the deadline too (time.monotonic is system-wide), so ranges still running
+        # after the budget stop at their next page instead of keeping the pool busy.
+        futures = [pool.submit(_extract_pdf_pages, source, start, stop, mode, deadline) for start, stop in ranges]
+        wait(futures, timeout=max(deadline - time.monotonic(), 0))
+
+        for future in futures:
+            if not future.done() or future.cancelled():
+                break
+            pages.extend(future.result())
+        for future in futures:
+            future.cancel()
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); replace the pool and finish this document inline.
+        logger.warning("PDF worker pool broke; extracting the remaining pages sequentially.")
+        _discard_pool(pool)
+        pages.extend(_extract_pdf_pages(source, len(pages), page_count, mode, deadline))
+    return pages
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_docx_text(source) -> str:
+    """Stream text out of a DOCX package without building the python-docx object model.
+
+    Headers, the body and footers are read in that order with an incremental XML parser.
+    Table cells, text boxes and other nested paragraphs each become their own line.
+    """
+    with zipfile.ZipFile(io.BytesIO(source) if isinstance(source, bytes) else source) as package:
+        names = set(package.namelist())
+        parts = _docx_parts(names, DOCX_HEADER_PATTERN)
+        parts += ["word/document.xml"] if "word/document.xml" in names else []
+        parts += _docx_parts(names, DOCX_FOOTER_PATTERN)
+
+        lines = []
+        for part in parts:
+            with package.open(part) as stream:
+                lines.extend(_iter_docx_paragraphs(stream))
+    return "\n".join(lines).strip()
+
+
+def _docx_parts(names, pattern) -> list[str]:
+    numbered = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            numbered.append((int(match.group(1) or 0), name))
+    return [name for _, name in sorted(numbered)]
+
+
+def _iter_docx_paragraphs(stream):
+    paragraphs = []
+    fallback_depth = 0
+    for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if tag == MC_FALLBACK:
+            # Text boxes are written twice (DrawingML and a VML fallback); keep only the first.
+            fallback_depth += 1 if event == "start" else -1
+            continue
+        if fallback_depth:
+            continue
 
+        if event == "start":
+            if tag == W_P:
+                paragraphs.append([])
+            continue
 
-def _extract_docx_text(file_path: str) -> str:
-    doc = Document(file_path)
-    return "\n".join(p.text for p in doc.paragraphs).strip()
+        if tag == W_T and paragraphs:
+            paragraphs[-1].append(elem.text or "")
+        elif tag == W_TAB and paragraphs:
+            paragraphs[-1].append("\t")
+        elif tag in (W_BR, W_CR) and paragraphs:
+            paragraphs[-1].append("\n")
+        elif tag == W_P:
+            text = "".join(paragraphs.pop())
+            if text.strip():
+                yield text
+            if not paragraphs:
+                elem.clear()
+        elif tag == W_TBL and not paragraphs:
+            elem.clear()
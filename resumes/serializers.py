@@ -1,19 +1,63 @@
 from rest_framework import serializers
 
-from .models import Resume
+from .models import Resume, ResumeBatch
 
 
 class ResumeUploadSerializer(serializers.Serializer):
     file = serializers.FileField()
+    # None means "not sent"; a plain BooleanField reads a missing multipart field as False.
+    async_parse = serializers.BooleanField(required=False, allow_null=True, default=None)
+
+
+class ResumeBulkUploadSerializer(serializers.Serializer):
+    archive = serializers.FileField()
+    async_parse = serializers.BooleanField(required=False, allow_null=True, default=None)
+
+
+class ResumeBatchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ResumeBatch
+        fields = (
+            "id",
+            "archive_name",
+            "status",
+            "total",
+            "processed",
+            "succeeded",
+            "failed",
+            "results",
+            "error",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = fields
 
 
 class ResumeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Resume
-        fields = ("id", "file", "uploaded_at", "extracted_text")
-        read_only_fields = ("id", "uploaded_at", "extracted_text")
+        fields = ("id", "file", "uploaded_at", "extracted_text", "status", "parse_error")
+        read_only_fields = ("id", "uploaded_at", "extracted_text", "status", "parse_error")
 
 
 class ResumeAnalyzeSerializer(serializers.Serializer):
     resume_id = serializers.IntegerField()
     job_description = serializers.CharField(min_length=30)
+    defer_ai = serializers.BooleanField(default=False)
+
+
+class ResumeRankSerializer(serializers.Serializer):
+    job_description = serializers.CharField(min_length=30)
+    resume_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=False, max_length=10000
+    )
+    user_id = serializers.IntegerField(required=False)
+    uploaded_after = serializers.DateTimeField(required=False)
+    uploaded_before = serializers.DateTimeField(required=False)
+    page = serializers.IntegerField(required=False, min_value=1, default=1)
+    page_size = serializers.IntegerField(required=False, min_value=1, max_value=100, default=25)
+
+
+class JobMatchSerializer(serializers.Serializer):
+    resume_id = serializers.IntegerField()
+    top_k = serializers.IntegerField(required=False, min_value=1, max_value=50, default=10)
@@ -0,0 +1,137 @@
+from ml.keywords import KEYWORD_MODEL, to_stored_vector
+from utils.nlp import document_features, features_version, parse_documents
+
+from .models import Resume
+
+
+def compute_resume_features(resume: Resume, save: bool = True) -> dict:
+    features = document_features(resume.extracted_text or "", include_ats=True)
+    if KEYWORD_MODEL.available():
+        features["keyword_vector"] = KEYWORD_MODEL.vector(features["processed"])
+    resume.features = features
+    resume.features_version = features_version()
+    if save and resume.pk:
+        resume.save(update_fields=["features", "features_version"])
+    return resume.features
+
+
+def find_parsed_duplicate(content_hash: str) -> Resume | None:
+    if not content_hash:
+        return None
+    return (
+        Resume.objects.filter(content_hash=content_hash, status=Resume.STATUS_PARSED)
+        .only("id", "file", "extracted_text", "features", "features_version")
+        .order_by("id")
+        .first()
+    )
+
+
+def copy_parsed_resume(resume: Resume, source: Resume, share_file: bool = False) -> Resume:
+    """Fill `resume` from an already parsed upload of the same file instead of parsing it again."""
+    resume.extracted_text = source.extracted_text
+    resume.parse_reused = True
+    if share_file:
+        # Point at the stored copy; FileField does not delete files with the row, so sharing is safe.
+        resume.file = source.file.name
+    if source.features and source.features_version == features_version():
+        resume.features = dict(source.features)
+        resume.features_version = source.features_version
+    else:
+        compute_resume_features(resume, save=False)
+    return resume
+
+
+def get_resume_features(resume: Resume) -> dict:
+    if resume.features and resume.features_version == features_version():
+        return resume.features
+    return compute_resume_features(resume)
+
+
+def get_resume_keyword_vector(resume: Resume) -> dict | None:
+    if not KEYWORD_MODEL.available():
+        return None
+    features = get_resume_features(resume)
+    stored = features.get("keyword_vector")
+    if stored and stored.get("version") == KEYWORD_MODEL.version:
+        return stored
+    features["keyword_vector"] = KEYWORD_MODEL.vector(features["processed"])
+    resume.save(update_fields=["features"])
+    return features["keyword_vector"]
+
+
+def ensure_resume_features(resumes: list[Resume]) -> list[dict]:
+    version = features_version()
+    stale = [resume for resume in resumes if not resume.features or resume.features_version != version]
+    if stale:
+        texts = dict(Resume.objects.filter(id__in=[resume.id for resume in stale]).values_list("id", "extracted_text"))
+        for resume in stale:
+            resume.extracted_text = texts.get(resume.id, "")
+        _refresh_batch(stale, version)
+
+    if KEYWORD_MODEL.available():
+        unvectorized = [
+            resume
+            for resume in resumes
+            if resume.features.get("keyword_vector", {}).get("version") != KEYWORD_MODEL.version
+        ]
+        if unvectorized:
+            _vectorize_batch(unvectorized)
+    return [resume.features for resume in resumes]
+
+
+def refresh_resume_features(queryset, batch_size: int = 200) -> int:
+    version = features_version()
+    updated = 0
+    batch = []
+    for resume in queryset.only("id", "extracted_text").iterator(chunk_size=batch_size):
+        batch.append(resume)
+        if len(batch) >= batch_size:
+            updated += _refresh_batch(batch, version)
+            batch = []
+    if batch:
+        updated += _refresh_batch(batch, version)
+    return updated
+
+
+def refresh_keyword_vectors(queryset, batch_size: int = 500) -> int:
+    updated = 0
+    batch = []
+    for resume in queryset.only("id", "features").iterator(chunk_size=batch_size):
+        batch.append(resume)
+        if len(batch) >= batch_size:
+            updated += _vectorize_batch(batch)
+            batch = []
+    if batch:
+        updated += _vectorize_batch(batch)
+    return updated
+
+
+def compute_features_batch(resumes: list[Resume], version: str | None = None) -> list[Resume]:
+    """Fill `features` for unsaved or stale resumes with one batched spaCy pass; does not save."""
+    version = version or features_version()
+    documents = parse_documents([resume.extracted_text or "" for resume in resumes])
+    for resume, document in zip(resumes, documents):
+        resume.features = document_features(document, include_ats=True)
+        resume.features_version = version
+    if KEYWORD_MODEL.available():
+        _attach_keyword_vectors(resumes)
+    return resumes
+
+
+def _refresh_batch(resumes: list[Resume], version: str) -> int:
+    compute_features_batch(resumes, version)
+    Resume.objects.bulk_update(resumes, ["features", "features_version"], batch_size=500)
+    return len(resumes)
+
+
+def _vectorize_batch(resumes: list[Resume]) -> int:
+    resumes = [resume for resume in resumes if resume.features]
+    _attach_keyword_vectors(resumes)
+    Resume.objects.bulk_update(resumes, ["features"], batch_size=500)
+    return len(resumes)
+
+
+def _attach_keyword_vectors(resumes: list[Resume]):
+    matrix = KEYWORD_MODEL.transform([resume.features.get("processed", "") for resume in resumes])
+    for position, resume in enumerate(resumes):
+        resume.features["keyword_vector"] = to_stored_vector(matrix[position], KEYWORD_MODEL.version)
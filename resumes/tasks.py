@@ -0,0 +1,60 @@
+import logging
+
+from celery import shared_task
+
+from .ingest import ingest_archive
+from .models import Resume, ResumeBatch
+from .parsers import extract_text_from_resume
+from .services import compute_resume_features
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="resumes.parse_resume")
+def parse_resume(resume_id: int) -> str:
+    try:
+        resume = Resume.objects.get(id=resume_id)
+    except Resume.DoesNotExist:
+        return "missing"
+    if resume.status != Resume.STATUS_PENDING:
+        return resume.status
+
+    try:
+        with resume.file.open("rb") as file:
+            resume.extracted_text = extract_text_from_resume(file, name=resume.file.name)
+        compute_resume_features(resume, save=False)
+    except Exception as exc:
+        logger.warning("Could not parse resume %s: %s", resume_id, exc)
+        resume.status = Resume.STATUS_FAILED
+        resume.parse_error = f"Could not parse file: {exc}"
+        resume.save(update_fields=["status", "parse_error"])
+        return resume.status
+
+    resume.status = Resume.STATUS_PARSED
+    resume.parse_error = ""
+    resume.save(update_fields=["extracted_text", "features", "features_version", "status", "parse_error"])
+    return resume.status
+
+
+@shared_task(name="resumes.ingest_resume_archive")
+def ingest_resume_archive(batch_id: int) -> str:
+    try:
+        batch = ResumeBatch.objects.get(id=batch_id)
+    except ResumeBatch.DoesNotExist:
+        return "missing"
+    if batch.status != ResumeBatch.STATUS_PENDING:
+        return batch.status
+
+    try:
+        with batch.archive.open("rb") as archive:
+            ingest_archive(batch, archive)
+    except Exception as exc:
+        logger.warning("Could not ingest resume batch %s: %s", batch_id, exc)
+        batch.status = ResumeBatch.STATUS_FAILED
+        batch.error = f"Could not read archive: {exc}"
+        batch.save(update_fields=["status", "error", "updated_at"])
+    finally:
+        # The archive is only needed while ingesting; the resumes keep their own copies.
+        batch.archive.delete(save=False)
+        batch.save(update_fields=["archive"])
+    return batch.status
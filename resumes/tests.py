@@ -0,0 +1,130 @@
+import io
+import shutil
+import tempfile
+import zipfile
+
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+
+from benchmarks.bench_pdf import build_pdf
+from users.models import User
+
+from .models import Resume, ResumeBatch
+from .parsers import _extract_pdf_text
+from .tasks import parse_resume
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def build_docx(text: str) -> bytes:
+    body = "".join(f"<w:p><w:r><w:t>{line}</w:t></w:r></w:p>" for line in text.splitlines())
+    document = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as package:
+        package.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+RESUME_TEXT = "Jane Doe\nExperience\nPython developer with 5 years of Django\nSkills\nPython, Django, PostgreSQL"
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    RESUME_ASYNC_UPLOAD=False,
+    CELERY_TASK_ALWAYS_EAGER=True,
+    CELERY_TASK_EAGER_PROPAGATES=True,
+)
+class AsyncUploadTests(APITestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="async@example.com", password="pw")
+        self.client.force_authenticate(self.user)
+
+    def _pending_resume(self, name: str, data: bytes) -> Resume:
+        return Resume.objects.create(user=self.user, file=ContentFile(data, name=name), status=Resume.STATUS_PENDING)
+
+    def test_async_upload_returns_202_with_job_id(self):
+        upload = SimpleUploadedFile("resume.docx", build_docx(RESUME_TEXT))
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/resume/upload/", {"file": upload, "async_parse": "true"}, format="multipart")
+
+        self.assertEqual(response.status_code, 202)
+        self.assertTrue(response.data["job_id"])
+        self.assertEqual(response.data["status"], Resume.STATUS_PENDING)
+        status_response = self.client.get(f"/api/resume/{response.data['id']}/status/")
+        self.assertEqual(status_response.data["status"], Resume.STATUS_PARSED)
+
+    @override_settings(RESUME_ASYNC_UPLOAD=True)
+    def test_async_upload_follows_setting_when_flag_missing(self):
+        upload = SimpleUploadedFile("resume.docx", build_docx(RESUME_TEXT))
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/resume/upload/", {"file": upload}, format="multipart")
+
+        self.assertEqual(response.status_code, 202)
+
+    def test_parse_resume_marks_pending_resume_parsed(self):
+        resume = self._pending_resume("resume.docx", build_docx(RESUME_TEXT))
+
+        result = parse_resume.delay(resume.id)
+
+        self.assertEqual(result.get(), Resume.STATUS_PARSED)
+        resume.refresh_from_db()
+        self.assertEqual(resume.status, Resume.STATUS_PARSED)
+        self.assertIn("Python developer", resume.extracted_text)
+        self.assertEqual(resume.parse_error, "")
+
+    def test_parse_resume_marks_corrupt_file_failed(self):
+        resume = self._pending_resume("resume.pdf", b"%PDF-1.4 this is not really a pdf")
+
+        result = parse_resume.delay(resume.id)
+
+        self.assertEqual(result.get(), Resume.STATUS_FAILED)
+        resume.refresh_from_db()
+        self.assertEqual(resume.status, Resume.STATUS_FAILED)
+        self.assertTrue(resume.parse_error.startswith("Could not parse file"))
+
+    def test_analyze_rejects_resume_that_is_not_parsed(self):
+        resume = self._pending_resume("resume.docx", build_docx(RESUME_TEXT))
+
+        response = self.client.post(
+            "/api/resume/analyze/",
+            {"resume_id": resume.id, "job_description": "Backend engineer with Python, Django and PostgreSQL."},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["status"], Resume.STATUS_PENDING)
+
+    @override_settings(RESUME_ASYNC_UPLOAD=True)
+    def test_bulk_upload_follows_setting_when_flag_missing(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("first.docx", build_docx(RESUME_TEXT))
+            archive.writestr("notes.txt", "not a resume")
+        upload = SimpleUploadedFile("resumes.zip", buffer.getvalue())
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/resume/bulk-upload/", {"archive": upload}, format="multipart")
+
+        self.assertEqual(response.status_code, 202)
+        batch = self.client.get(f"/api/resume/batches/{response.data['id']}/").data
+        self.assertEqual(batch["status"], ResumeBatch.STATUS_COMPLETED)
+        self.assertEqual((batch["succeeded"], batch["failed"]), (1, 1))
+
+
+class PdfLimitTests(SimpleTestCase):
+    def test_pages_past_max_pages_are_dropped_with_a_warning(self):
+        with self.assertLogs("resumes.parsers", "WARNING") as logs:
+            text = _extract_pdf_text(build_pdf(5, lines_per_page=3), mode="fast", max_pages=2, workers=1)
+
+        self.assertIn("page 2 line 1", text)
+        self.assertNotIn("page 3 line 1", text)
+        self.assertIn("5 pages", logs.output[0])
@@ -0,0 +1,39 @@
+import hashlib
+
+from django.core.files.uploadhandler import FileUploadHandler
+
+
+class ContentHashUploadHandler(FileUploadHandler):
+    """Compute a SHA-256 of each uploaded file while its chunks stream in.
+
+    The handler only observes data and passes every chunk on to the next handler, so the
+    regular memory/temporary-file handlers still build the `UploadedFile`. Digests are
+    kept on the request in `upload_content_hashes`, keyed by form field name.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.digest = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.digest.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if not hasattr(self.request, "upload_content_hashes"):
+            self.request.upload_content_hashes = {}
+        self.request.upload_content_hashes[self.field_name] = self.digest.hexdigest()
+        return None
+
+
+def content_hash(uploaded_file, request=None, field_name: str = "file") -> str:
+    """Return the upload's SHA-256, reusing the digest computed during streaming when available."""
+    hashes = getattr(request, "upload_content_hashes", None) or {}
+    if field_name in hashes:
+        return hashes[field_name]
+
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    uploaded_file.seek(0)
+    return digest.hexdigest()
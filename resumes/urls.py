@@ -1,9 +1,23 @@
 from django.urls import path
+from rest_framework.renderers import JSONRenderer
+
+from analysis.streaming import EventStreamRenderer
 
 from .views import ResumeViewSet
 
 urlpatterns = [
     path("upload/", ResumeViewSet.as_view({"post": "upload"}), name="resume-upload"),
+    path("bulk-upload/", ResumeViewSet.as_view({"post": "bulk_upload"}), name="resume-bulk-upload"),
+    path("batches/<int:pk>/", ResumeViewSet.as_view({"get": "batch_status"}), name="resume-batch-status"),
+    path("<int:pk>/status/", ResumeViewSet.as_view({"get": "parse_status"}), name="resume-status"),
     path("analyze/", ResumeViewSet.as_view({"post": "analyze"}), name="resume-analyze"),
+    path("rank/", ResumeViewSet.as_view({"post": "rank"}), name="resume-rank"),
+    path("match-jobs/", ResumeViewSet.as_view({"post": "match_jobs"}), name="resume-match-jobs"),
     path("history/", ResumeViewSet.as_view({"get": "history"}), name="resume-history"),
+    path("analyses/<int:pk>/", ResumeViewSet.as_view({"get": "analysis_detail"}), name="resume-analysis-detail"),
+    path(
+        "analyses/<int:pk>/stream/",
+        ResumeViewSet.as_view({"get": "analysis_stream"}, renderer_classes=[EventStreamRenderer, JSONRenderer]),
+        name="resume-analysis-stream",
+    ),
 ]
@@ -1,13 +1,28 @@
+import zipfile
+
 from rest_framework.exceptions import ValidationError
 
 
 MAX_FILE_SIZE_MB = 5
+MAX_ARCHIVE_SIZE_MB = 100
 ALLOWED_EXTENSIONS = {".pdf", ".docx"}
 
 
-def validate_resume_file(uploaded_file):
-    extension = "." + uploaded_file.name.split(".")[-1].lower()
+def validate_resume_name_and_size(name: str, size: int):
+    extension = "." + name.split(".")[-1].lower()
     if extension not in ALLOWED_EXTENSIONS:
         raise ValidationError("Only PDF and DOCX files are supported")
-    if uploaded_file.size > MAX_FILE_SIZE_MB * 1024 * 1024:
+    if size > MAX_FILE_SIZE_MB * 1024 * 1024:
         raise ValidationError(f"File size must be <= {MAX_FILE_SIZE_MB}MB")
+
+
+def validate_resume_file(uploaded_file):
+    validate_resume_name_and_size(uploaded_file.name, uploaded_file.size)
+
+
+def validate_resume_archive(uploaded_file):
+    if not uploaded_file.name.lower().endswith(".zip") or not zipfile.is_zipfile(uploaded_file):
+        raise ValidationError("Only ZIP archives are supported")
+    uploaded_file.seek(0)
+    if uploaded_file.size > MAX_ARCHIVE_SIZE_MB * 1024 * 1024:
+        raise ValidationError(f"Archive size must be <= {MAX_ARCHIVE_SIZE_MB}MB")
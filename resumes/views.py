@@ -1,14 +1,44 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Count, Max
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
 from rest_framework import status, viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from analysis.serializers import AnalysisSerializer
-from analysis.services import run_analysis
+from analysis.models import Analysis, JobPosting
+from analysis.ranking import match_job_postings, rank_resumes
+from analysis.serializers import AnalysisSerializer, AnalysisSummarySerializer
+from analysis.services import get_or_run_analysis
+from analysis.streaming import analysis_events
+from users.permissions import IsAdminRole
 
-from .models import Resume
+from .ingest import ingest_archive
+from .models import Resume, ResumeBatch
+from .pagination import HistoryPagination
 from .parsers import extract_text_from_resume
-from .serializers import ResumeUploadSerializer, ResumeAnalyzeSerializer
-from .validators import validate_resume_file
+from .serializers import (
+    JobMatchSerializer,
+    ResumeAnalyzeSerializer,
+    ResumeBatchSerializer,
+    ResumeBulkUploadSerializer,
+    ResumeRankSerializer,
+    ResumeUploadSerializer,
+)
+from .services import compute_resume_features, copy_parsed_resume, find_parsed_duplicate
+from .tasks import ingest_resume_archive, parse_resume
+from .uploads import content_hash
+from .validators import validate_resume_archive, validate_resume_file
+
+
+def _async_requested(serializer) -> bool:
+    async_parse = serializer.validated_data["async_parse"]
+    return settings.RESUME_ASYNC_UPLOAD if async_parse is None else async_parse
 
 
 class ResumeViewSet(viewsets.ViewSet):
@@ -19,26 +49,93 @@ class ResumeViewSet(viewsets.ViewSet):
         serializer.is_valid(raise_exception=True)
         resume_file = serializer.validated_data["file"]
         validate_resume_file(resume_file)
+        file_hash = content_hash(resume_file, request)
+
+        duplicate = find_parsed_duplicate(file_hash)
+        if duplicate is not None:
+            resume = Resume(user=request.user, file=resume_file, content_hash=file_hash)
+            copy_parsed_resume(resume, duplicate, share_file=settings.RESUME_DEDUP_SHARED_STORAGE)
+            resume.save()
+            return self._uploaded(resume)
 
-        resume = Resume.objects.create(user=request.user, file=resume_file)
+        if _async_requested(serializer):
+            return self._upload_async(request, resume_file, file_hash)
+
+        # Parse straight from the upload buffer; the row and the stored file only exist once parsing succeeded.
         try:
-            resume.extracted_text = extract_text_from_resume(resume.file.path)
+            extracted_text = extract_text_from_resume(resume_file)
         except Exception as exc:
-            resume.delete()
             return Response({"detail": f"Could not parse file: {exc}"}, status=status.HTTP_400_BAD_REQUEST)
 
-        resume.save(update_fields=["extracted_text"])
+        resume = Resume(user=request.user, file=resume_file, extracted_text=extracted_text, content_hash=file_hash)
+        compute_resume_features(resume, save=False)
+        resume.save()
+        return self._uploaded(resume)
 
+    def _uploaded(self, resume):
         return Response(
             {
                 "id": resume.id,
                 "file": resume.file.url,
                 "uploaded_at": resume.uploaded_at,
+                "deduplicated": resume.parse_reused,
                 "message": "Resume uploaded and parsed successfully",
             },
             status=status.HTTP_201_CREATED,
         )
 
+    def _upload_async(self, request, resume_file, file_hash):
+        resume = Resume.objects.create(
+            user=request.user, file=resume_file, content_hash=file_hash, status=Resume.STATUS_PENDING
+        )
+        job_id = str(uuid.uuid4())
+        transaction.on_commit(lambda: parse_resume.apply_async(args=[resume.id], task_id=job_id))
+        return Response(
+            {
+                "id": resume.id,
+                "job_id": job_id,
+                "status": resume.status,
+                "file": resume.file.url,
+                "uploaded_at": resume.uploaded_at,
+                "message": "Resume uploaded; parsing in background",
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    def bulk_upload(self, request):
+        serializer = ResumeBulkUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        archive = serializer.validated_data["archive"]
+        validate_resume_archive(archive)
+
+        if _async_requested(serializer):
+            batch = ResumeBatch.objects.create(user=request.user, archive=archive, archive_name=archive.name)
+            job_id = str(uuid.uuid4())
+            transaction.on_commit(lambda: ingest_resume_archive.apply_async(args=[batch.id], task_id=job_id))
+            return Response(
+                {"id": batch.id, "job_id": job_id, "status": batch.status, "message": "Archive queued for ingestion"},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        # Read entries straight from the uploaded archive; it is never written to storage.
+        batch = ResumeBatch.objects.create(user=request.user, archive_name=archive.name)
+        ingest_archive(batch, archive)
+        return Response(ResumeBatchSerializer(batch).data, status=status.HTTP_201_CREATED)
+
+    def batch_status(self, request, pk=None):
+        try:
+            batch = ResumeBatch.objects.get(id=pk, user=request.user)
+        except ResumeBatch.DoesNotExist:
+            return Response({"detail": "Batch not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ResumeBatchSerializer(batch).data)
+
+    def parse_status(self, request, pk=None):
+        try:
+            resume = Resume.objects.only("id", "status", "parse_error").get(id=pk, user=request.user)
+        except Resume.DoesNotExist:
+            return Response({"detail": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"id": resume.id, "status": resume.status, "error": resume.parse_error})
+
     def analyze(self, request):
         serializer = ResumeAnalyzeSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -50,11 +147,120 @@ class ResumeViewSet(viewsets.ViewSet):
             resume = Resume.objects.get(id=resume_id, user=request.user)
         except Resume.DoesNotExist:
             return Response({"detail": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
+        if resume.status != Resume.STATUS_PARSED:
+            return Response({"detail": f"Resume is {resume.status}", "status": resume.status}, status=status.HTTP_409_CONFLICT)
 
-        analysis = run_analysis(resume=resume, job_description=job_description)
-        return Response(AnalysisSerializer(analysis).data)
+        analysis, created = get_or_run_analysis(
+            resume=resume, job_description=job_description, defer_ai=serializer.validated_data["defer_ai"]
+        )
+        return Response(AnalysisSerializer(analysis).data, headers={"X-Analysis-Cache": "miss" if created else "hit"})
+
+    def rank(self, request):
+        serializer = ResumeRankSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        queryset = Resume.objects.filter(status=Resume.STATUS_PARSED)
+        if not IsAdminRole().has_permission(request, self):
+            queryset = queryset.filter(user=request.user)
+        elif "user_id" in data:
+            queryset = queryset.filter(user_id=data["user_id"])
+        if "resume_ids" in data:
+            queryset = queryset.filter(id__in=data["resume_ids"])
+        if "uploaded_after" in data:
+            queryset = queryset.filter(uploaded_at__gte=data["uploaded_after"])
+        if "uploaded_before" in data:
+            queryset = queryset.filter(uploaded_at__lt=data["uploaded_before"])
+
+        ranking = rank_resumes(
+            queryset,
+            job_description=data["job_description"],
+            page=data["page"],
+            page_size=data["page_size"],
+        )
+        return Response(ranking)
+
+    def match_jobs(self, request):
+        serializer = JobMatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            resume = Resume.objects.get(
+                id=serializer.validated_data["resume_id"], user=request.user, status=Resume.STATUS_PARSED
+            )
+        except Resume.DoesNotExist:
+            return Response({"detail": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        matches = match_job_postings(
+            resume,
+            JobPosting.objects.filter(is_active=True),
+            top_k=serializer.validated_data["top_k"],
+        )
+        return Response(matches)
 
     def history(self, request):
-        queryset = Resume.objects.filter(user=request.user).prefetch_related("analyses")
-        items = [analysis for resume in queryset for analysis in resume.analyses.all()]
-        return Response(AnalysisSerializer(items, many=True).data)
+        """Cursor-paginated analyses, newest first; `?fields=compact` drops the long text fields.
+
+        Responses carry an ETag and Last-Modified derived from the user's analyses, so an
+        unchanged history (and query) answers conditional requests with 304.
+        """
+        compact = request.query_params.get("fields") == "compact"
+        analyses = Analysis.objects.filter(resume__user=request.user)
+        state = analyses.aggregate(
+            count=Count("id"),
+            last_modified=Max("updated_at"),
+            average_match_score=Avg("match_score"),
+            best_match_score=Max("match_score"),
+        )
+
+        last_modified = state["last_modified"]
+        fingerprint = f"{request.user.pk}:{state['count']}:{last_modified and last_modified.timestamp()}:{request.GET.urlencode()}"
+        etag = f'"{hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()}"'
+        not_modified = get_conditional_response(
+            request._request, etag=etag, last_modified=last_modified and int(last_modified.timestamp())
+        )
+        if not_modified is not None:
+            return self._with_validators(not_modified, etag, last_modified)
+
+        serializer_class = AnalysisSummarySerializer if compact else AnalysisSerializer
+        # Only the columns the serializer reads; `resume` is the FK id on the row, so no join is needed.
+        concrete = {field.name for field in Analysis._meta.concrete_fields}
+        queryset = analyses.only(*(name for name in serializer_class.Meta.fields if name in concrete))
+        paginator = HistoryPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        summary = None
+        if not request.query_params.get(paginator.cursor_query_param):
+            summary = {
+                "total_analyses": state["count"],
+                "average_match_score": round(state["average_match_score"] or 0.0, 2),
+                "best_match_score": round(state["best_match_score"] or 0.0, 2),
+            }
+        response = paginator.get_paginated_response(serializer_class(page, many=True).data, summary=summary)
+        return self._with_validators(response, etag, last_modified)
+
+    def _with_validators(self, response, etag, last_modified):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+        # Private per user; clients must revalidate, which is cheap thanks to the validators.
+        response["Cache-Control"] = "private, no-cache"
+        patch_vary_headers(response, ("Authorization",))
+        return response
+
+    def analysis_detail(self, request, pk=None):
+        try:
+            analysis = Analysis.objects.get(id=pk, resume__user=request.user)
+        except Analysis.DoesNotExist:
+            return Response({"detail": "Analysis not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(AnalysisSerializer(analysis).data)
+
+    def analysis_stream(self, request, pk=None):
+        try:
+            analysis = Analysis.objects.select_related("resume").get(id=pk, resume__user=request.user)
+        except Analysis.DoesNotExist:
+            return Response({"detail": "Analysis not found"}, status=status.HTTP_404_NOT_FOUND)
+        response = StreamingHttpResponse(analysis_events(analysis), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx from buffering the stream until it ends.
+        response["X-Accel-Buffering"] = "no"
+        return response
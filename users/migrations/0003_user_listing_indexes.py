@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+EMAIL_PREFIX_INDEX = "users_user_email_upper_prefix_idx"
+
+
+def create_email_prefix_index(apps, schema_editor):
+    # `email__istartswith` compiles to UPPER(email) LIKE UPPER(...); only an expression index
+    # with a pattern opclass lets PostgreSQL answer that with an index range scan.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {EMAIL_PREFIX_INDEX} ON users_user (UPPER(email::text) text_pattern_ops)"
+    )
+
+
+def drop_email_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {EMAIL_PREFIX_INDEX}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0002_user_is_superuser_alter_user_date_joined_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["-date_joined", "-id"], name="users_joined_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["role", "-date_joined", "-id"], name="users_role_joined_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["is_active", "-date_joined", "-id"], name="users_active_joined_id_idx"),
+        ),
+        migrations.RunPython(create_email_prefix_index, drop_email_prefix_index),
+    ]
@@ -23,5 +23,13 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     objects = UserManager()
 
+    class Meta:
+        indexes = [
+            # Keyset pagination of the admin listing, optionally narrowed by role or active flag.
+            models.Index(fields=["-date_joined", "-id"], name="users_joined_id_idx"),
+            models.Index(fields=["role", "-date_joined", "-id"], name="users_role_joined_id_idx"),
+            models.Index(fields=["is_active", "-date_joined", "-id"], name="users_active_joined_id_idx"),
+        ]
+
     def __str__(self):
         return self.email
@@ -0,0 +1,40 @@
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+
+class DateJoinedKeysetPagination:
+    """Keyset pagination over `(date_joined, id)`, newest first.
+
+    The cursor encodes the last row's `date_joined` and `id`, so every page is an index range
+    scan no matter how deep the client pages, unlike OFFSET pagination.
+    """
+
+    page_size = 50
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset, cursor: str | None, page_size: int | None = None) -> tuple[list, str | None]:
+        page_size = min(page_size or self.page_size, self.max_page_size)
+        queryset = queryset.order_by("-date_joined", "-id")
+        if cursor:
+            joined, last_id = self.decode_cursor(cursor)
+            queryset = queryset.filter(Q(date_joined__lt=joined) | Q(date_joined=joined, id__lt=last_id))
+
+        rows = list(queryset[: page_size + 1])
+        next_cursor = self.encode_cursor(rows[page_size - 1]) if len(rows) > page_size else None
+        return rows[:page_size], next_cursor
+
+    @staticmethod
+    def encode_cursor(user) -> str:
+        raw = f"{user.date_joined.isoformat()}|{user.id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            joined, last_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+            return datetime.fromisoformat(joined), int(last_id)
+        except (ValueError, UnicodeError) as exc:
+            raise ValidationError({"cursor": "Invalid cursor"}) from exc
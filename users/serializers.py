@@ -49,3 +49,19 @@ class UserListSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("id", "email", "first_name", "last_name", "role", "is_active", "date_joined")
+
+
+class AdminUserListSerializer(UserListSerializer):
+    resume_count = serializers.IntegerField(read_only=True)
+    analysis_count = serializers.IntegerField(read_only=True)
+
+    class Meta(UserListSerializer.Meta):
+        fields = UserListSerializer.Meta.fields + ("resume_count", "analysis_count")
+
+
+class AdminUserFilterSerializer(serializers.Serializer):
+    email = serializers.CharField(required=False, max_length=254)
+    role = serializers.ChoiceField(choices=User.ROLE_CHOICES, required=False)
+    is_active = serializers.BooleanField(required=False, allow_null=True, default=None)
+    cursor = serializers.CharField(required=False)
+    page_size = serializers.IntegerField(required=False, min_value=1, max_value=200, default=50)
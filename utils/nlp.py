@@ -1,45 +1,118 @@
+import hashlib
 import json
+import logging
+import os
 import re
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import nltk
-from nltk.corpus import stopwords
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+logger = logging.getLogger(__name__)
 
-try:
-    import spacy
-except Exception:
-    spacy = None
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+PIPELINE_PROFILES = {
+    "full": (),
+    "lean": ("parser", "ner", "senter"),
+    "tokenizer": ("tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"),
+}
+PIPELINE_PROFILE = os.getenv("SPACY_PIPELINE_PROFILE", "lean")
+BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "64"))
+N_PROCESS = int(os.getenv("SPACY_N_PROCESS", "1"))
+NLTK_AUTO_DOWNLOAD = os.getenv("NLTK_AUTO_DOWNLOAD", "true").lower() in {"1", "true", "yes"}
 
 
-for resource in ("stopwords", "punkt"):
+def load_pipeline(profile: str = PIPELINE_PROFILE):
     try:
-        nltk.data.find(f"corpora/{resource}")
-    except LookupError:
-        nltk.download(resource, quiet=True)
-
-STOPWORDS = set(stopwords.words("english"))
-
-NLP = None
-if spacy is not None:
+        import spacy
+    except Exception:
+        return None
     try:
-        NLP = spacy.load("en_core_web_sm")
+        return spacy.load(SPACY_MODEL, exclude=list(PIPELINE_PROFILES.get(profile, PIPELINE_PROFILES["lean"])))
     except Exception:
         try:
-            NLP = spacy.blank("en")
+            return spacy.blank("en")
         except Exception:
-            NLP = None
+            return None
 
-SKILLS_FILE = Path(__file__).resolve().parent / "skills.json"
 
+def _load_stopwords(download: bool = NLTK_AUTO_DOWNLOAD) -> frozenset:
+    try:
+        import nltk
+        from nltk.corpus import stopwords
+    except Exception:
+        return frozenset()
+
+    try:
+        return frozenset(stopwords.words("english"))
+    except LookupError:
+        if download and nltk.download("stopwords", quiet=True):
+            return frozenset(stopwords.words("english"))
+    logger.warning("NLTK stopwords corpus is unavailable; falling back to scikit-learn stop words.")
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 
-def _load_skills():
-    with open(SKILLS_FILE, "r", encoding="utf-8") as file:
-        return set(json.load(file)["skills"])
+    return frozenset(ENGLISH_STOP_WORDS)
 
 
-KNOWN_SKILLS = _load_skills()
+class ResourceRegistry:
+    """Loads NLP resources on first use; nothing is read or downloaded at import time."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._resources = {}
+
+    def get(self, name: str, **options):
+        try:
+            return self._resources[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._resources:
+                self._resources[name] = self._loaders()[name](**options)
+            return self._resources[name]
+
+    def loaded(self) -> list[str]:
+        return sorted(self._resources)
+
+    def reset(self):
+        with self._lock:
+            self._resources.clear()
+
+    def _loaders(self) -> dict:
+        return {
+            "stopwords": _load_stopwords,
+            "nlp": load_pipeline,
+            "skills": _load_skills,
+            "skill_matcher": _build_skill_matcher,
+            "features_version": _features_version,
+        }
+
+
+RESOURCES = ResourceRegistry()
+
+
+def warmup(download: bool = NLTK_AUTO_DOWNLOAD):
+    RESOURCES.get("stopwords", download=download)
+    for name in ("nlp", "skills", "skill_matcher"):
+        RESOURCES.get(name)
+    return RESOURCES.loaded()
+
+
+def __getattr__(name: str):
+    # Module-level names kept for callers that predate lazy loading.
+    if name == "NLP":
+        return RESOURCES.get("nlp")
+    if name == "STOPWORDS":
+        return RESOURCES.get("stopwords")
+    if name == "KNOWN_SKILLS":
+        return RESOURCES.get("skills")[0]
+    if name == "SKILL_ALIASES":
+        return RESOURCES.get("skills")[1]
+    if name == "SKILL_MATCHER":
+        return RESOURCES.get("skill_matcher")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+SKILLS_FILE = Path(__file__).resolve().parent / "skills.json"
 
 
 def clean_text(text: str) -> str:
@@ -49,51 +122,168 @@ def clean_text(text: str) -> str:
     return text
 
 
-def preprocess_text(text: str) -> str:
+class SkillMatcher:
+    """Token trie over skill phrases; longest match wins on word boundaries in one pass."""
+
+    _TERMINAL = ""
+
+    def __init__(self, phrases: dict[str, str]):
+        self._root = {}
+        for phrase, skill in phrases.items():
+            tokens = phrase.split()
+            if not tokens:
+                continue
+            node = self._root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[self._TERMINAL] = skill
+
+    def find(self, cleaned: str) -> set[str]:
+        tokens = cleaned.split()
+        found = set()
+        start = 0
+        while start < len(tokens):
+            node = self._root.get(tokens[start])
+            position = start + 1
+            match, match_end = None, start + 1
+            while node is not None:
+                skill = node.get(self._TERMINAL)
+                if skill:
+                    match, match_end = skill, position
+                if position >= len(tokens):
+                    break
+                node = node.get(tokens[position])
+                position += 1
+            if match:
+                found.add(match)
+            start = match_end
+        return found
+
+
+def _load_skills():
+    with open(SKILLS_FILE, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    skills = {clean_text(skill) for skill in data["skills"]}
+    aliases = {clean_text(alias): clean_text(skill) for alias, skill in data.get("aliases", {}).items()}
+    return skills, aliases
+
+
+def _build_skill_matcher() -> SkillMatcher:
+    skills, aliases = RESOURCES.get("skills")
+    return SkillMatcher({**aliases, **{skill: skill for skill in skills}})
+
+
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+PHONE_PATTERN = re.compile(r"\+?\d[\d\s\-]{8,}\d")
+YEARS_PATTERN = re.compile(r"(\d+)\+?\s+years?")
+ATS_SECTIONS = ("experience", "education", "skills", "projects", "summary")
+FEATURES_SCHEMA_VERSION = 1
+
+
+@dataclass
+class ParsedDocument:
+    """Everything the scorers need from one input, computed a single time."""
+
+    text: str
+    cleaned: str
+    doc: object = None
+    lemmas: list[str] = field(default_factory=list)
+    tokens: set[str] = field(default_factory=set)
+    years: int = 0
+    has_email: bool = False
+    has_phone: bool = False
+
+    @property
+    def processed(self) -> str:
+        return " ".join(self.lemmas)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.cleaned.split())
+
+
+def parse_document(text: str) -> ParsedDocument:
+    text = text or ""
     cleaned = clean_text(text)
-    if NLP is None:
-        return " ".join(token for token in cleaned.split() if token and token not in STOPWORDS)
+    nlp = RESOURCES.get("nlp")
+    doc = nlp(cleaned) if nlp is not None else None
+    return _build_document(text, cleaned, doc)
+
+
+def parse_documents(texts, batch_size: int | None = None, n_process: int | None = None) -> list[ParsedDocument]:
+    texts = [text or "" for text in texts]
+    cleaned = [clean_text(text) for text in texts]
+    nlp = RESOURCES.get("nlp")
+    if nlp is None:
+        docs = [None] * len(texts)
+    else:
+        docs = nlp.pipe(cleaned, batch_size=batch_size or BATCH_SIZE, n_process=n_process or N_PROCESS)
+    return [_build_document(text, clean, doc) for text, clean, doc in zip(texts, cleaned, docs)]
+
+
+def _build_document(text: str, cleaned: str, doc) -> ParsedDocument:
+    return ParsedDocument(
+        text=text,
+        cleaned=cleaned,
+        doc=doc,
+        lemmas=_lemmas(cleaned, doc),
+        tokens=set(cleaned.split()),
+        years=_extract_years(text),
+        has_email=bool(EMAIL_PATTERN.search(text)),
+        has_phone=bool(PHONE_PATTERN.search(text)),
+    )
+
+
+def _as_document(value) -> ParsedDocument:
+    if isinstance(value, ParsedDocument):
+        return value
+    return parse_document(value)
+
+
+def _lemmas(cleaned: str, doc) -> list[str]:
+    stopwords = RESOURCES.get("stopwords")
+    if doc is None:
+        return [token for token in cleaned.split() if token and token not in stopwords]
 
-    doc = NLP(cleaned)
     tokens = []
     for token in doc:
         lemma = token.lemma_.strip() if token.lemma_ else token.text.strip()
-        if lemma and lemma not in STOPWORDS and not token.is_space:
+        if lemma and lemma not in stopwords and not token.is_space:
             tokens.append(lemma)
-    return " ".join(tokens)
+    return tokens
+
 
+def preprocess_text(text) -> str:
+    return _as_document(text).processed
 
-def keyword_similarity_score(resume_text: str, job_description: str) -> float:
-    p_resume = preprocess_text(resume_text)
-    p_jd = preprocess_text(job_description)
 
+def keyword_similarity_score(resume_text, job_description) -> float:
+    return processed_similarity_score(preprocess_text(resume_text), preprocess_text(job_description))
+
+
+def processed_similarity_score(p_resume: str, p_jd: str) -> float:
     if not p_resume or not p_jd:
         return 0.0
 
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
     vectorizer = TfidfVectorizer()
     matrix = vectorizer.fit_transform([p_resume, p_jd])
     score = cosine_similarity(matrix[0:1], matrix[1:2])[0][0]
     return max(0.0, min(score * 100, 100.0))
 
 
-def extract_skills(text: str):
-    cleaned = clean_text(text)
-    found = {skill for skill in KNOWN_SKILLS if skill in cleaned}
-
-    if NLP is not None:
-        doc = NLP(cleaned)
-        for ent in doc.ents:
-            candidate = ent.text.strip().lower()
-            if candidate in KNOWN_SKILLS:
-                found.add(candidate)
+def extract_skills(text):
+    cleaned = text.cleaned if isinstance(text, ParsedDocument) else clean_text(text)
+    return sorted(RESOURCES.get("skill_matcher").find(cleaned))
 
-    return sorted(found)
 
+def experience_relevance_score(resume_text, job_description) -> float:
+    return years_relevance_score(_as_document(resume_text).years, _as_document(job_description).years)
 
-def experience_relevance_score(resume_text: str, job_description: str) -> float:
-    resume_years = _extract_years(resume_text)
-    jd_years = _extract_years(job_description)
 
+def years_relevance_score(resume_years: int, jd_years: int) -> float:
     if jd_years == 0:
         return 70.0
     if resume_years == 0:
@@ -103,21 +293,37 @@ def experience_relevance_score(resume_text: str, job_description: str) -> float:
     return max(0.0, min(ratio * 80, 100.0))
 
 
-def ats_compliance_score(resume_text: str) -> float:
-    text = clean_text(resume_text)
-    sections = ["experience", "education", "skills", "projects", "summary"]
-    section_points = sum(1 for section in sections if section in text) / len(sections) * 70
+def ats_compliance_score(resume_text) -> float:
+    document = _as_document(resume_text)
+    section_points = sum(1 for section in ATS_SECTIONS if section in document.cleaned) / len(ATS_SECTIONS) * 70
+    contact_points = (int(document.has_email) + int(document.has_phone)) / 2 * 20
+    length_points = 10 if 300 <= document.word_count <= 1200 else 5
+    return round(section_points + contact_points + length_points, 2)
 
-    has_email = 1 if re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", resume_text) else 0
-    has_phone = 1 if re.search(r"\+?\d[\d\s\-]{8,}\d", resume_text) else 0
-    contact_points = (has_email + has_phone) / 2 * 20
 
-    length_points = 10 if 300 <= len(text.split()) <= 1200 else 5
-    return round(section_points + contact_points + length_points, 2)
+def document_features(text, include_ats: bool = False) -> dict:
+    document = _as_document(text)
+    features = {
+        "processed": document.processed,
+        "skills": extract_skills(document),
+        "years": document.years,
+    }
+    if include_ats:
+        features["ats_compliance"] = ats_compliance_score(document)
+    return features
+
+
+def features_version() -> str:
+    return RESOURCES.get("features_version")
+
+
+def _features_version() -> str:
+    digest = hashlib.sha1(SKILLS_FILE.read_bytes()).hexdigest()[:12]
+    return f"{FEATURES_SCHEMA_VERSION}:{PIPELINE_PROFILE}:{digest}"
 
 
 def _extract_years(text: str) -> int:
-    matches = re.findall(r"(\d+)\+?\s+years?", text.lower())
+    matches = YEARS_PATTERN.findall(text.lower())
     if not matches:
         return 0
     return max(int(v) for v in matches)